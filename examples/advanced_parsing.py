@@ -205,25 +205,23 @@ def test_type_detection_with_parsing():
         print(f"   Detected type: {type_result['type']}")
         print(f"   Confidence: {type_result['confidence']:.2%}")
         
-        # Parse values based on detected type
-        print(f"   Parsing results:")
-        for value in df[column]:
+        # Parse values based on detected type, collecting output lines for one print
+        lines = [f"   Parsing results:"]
+        if type_result['type'] in ('number', 'date'):
+            # Parse the whole column in one vectorized call
             if type_result['type'] == 'number':
-                parsed = format_parser.parse_amount(value)
-                if parsed.get('error'):
-                    print(f"     ❌ {value}: {parsed['error']}")
-                else:
-                    print(f"     ✅ {value} → {parsed['parsed_value']}")
-            
-            elif type_result['type'] == 'date':
-                parsed = format_parser.parse_date(value)
-                if parsed.get('error'):
-                    print(f"     ❌ {value}: {parsed['error']}")
-                else:
-                    print(f"     ✅ {value} → {parsed['parsed_value']}")
-            
+                parsed_values = format_parser.parse_amount_series(df[column])
             else:
-                print(f"     📝 {value} (string)")
+                parsed_values = format_parser.parse_date_series(df[column])
+            for value, parsed in zip(df[column], parsed_values.itertuples(index=False)):
+                if parsed.error:
+                    lines.append(f"     ❌ {value}: {parsed.error}")
+                else:
+                    lines.append(f"     ✅ {value} → {parsed.parsed_value}")
+        
+        else:
+            lines.extend(f"     📝 {value} (string)" for value in df[column])
+        print("\n".join(lines))
     
     print("\n" + "=" * 60)
 
@@ -81,20 +81,23 @@ def main():
             try:
                 preview_df = excel_processor.preview_data(file_path, sheet_name, rows=3)
                 print(f"      Sample data:")
-                for i, row in preview_df.iterrows():
-                    print(f"        Row {i+1}: {list(row.values)[:3]}...")
+                preview_rows = preview_df.iloc[:, :3].to_numpy()
+                for i, row in enumerate(preview_rows, 1):
+                    print(f"        Row {i}: {row.tolist()}...")
             except Exception as e:
                 print(f"      ❌ Error previewing data: {str(e)}")
     
     print("\n3. Data Type Detection...")
     print("-" * 40)
     
+    # Read every sheet once and reuse it for type detection and quality checks
+    sheets_by_file = {file_path: excel_processor.get_all_sheets_data(file_path) for file_path in sample_files}
+    
     # Perform type detection on each file
     for file_path in sample_files:
         print(f"\n🔍 Analyzing data types for: {os.path.basename(file_path)}")
         
-        # Get all sheets data
-        all_sheets_data = excel_processor.get_all_sheets_data(file_path)
+        all_sheets_data = sheets_by_file[file_path]
         
         for sheet_name, df in all_sheets_data.items():
             print(f"\n   📊 Sheet: {sheet_name}")
@@ -128,7 +131,7 @@ def main():
                 column_analysis[column] = type_result
             
             # Create summary report
-            summary = create_summary_report(df, f"Analysis of {sheet_name}")
+            summary = create_summary_report(df, f"Analysis of {sheet_name}", deep=True)
             print(f"\n      📈 Summary:")
             print(f"         Rows: {summary['basic_info']['rows']}")
             print(f"         Columns: {summary['basic_info']['columns']}")
@@ -142,7 +145,7 @@ def main():
     for file_path in sample_files:
         print(f"\n🔍 Quality assessment for: {os.path.basename(file_path)}")
         
-        all_sheets_data = excel_processor.get_all_sheets_data(file_path)
+        all_sheets_data = sheets_by_file[file_path]
         
         for sheet_name, df in all_sheets_data.items():
             print(f"\n   📊 Sheet: {sheet_name}")
@@ -155,9 +158,9 @@ def main():
             print(f"      Duplicate rows: {duplicate_rows}")
             print(f"      Unique values per column:")
             
-            for column in df.columns:
-                unique_count = df[column].nunique()
-                total_count = len(df)
+            unique_counts = df.nunique(dropna=True)
+            total_count = len(df)
+            for column, unique_count in unique_counts.items():
                 unique_percentage = (unique_count / total_count) * 100
                 print(f"         {column}: {unique_count}/{total_count} ({unique_percentage:.1f}%)")
     
@@ -23,48 +23,87 @@ import numpy as np
 from datetime import datetime, timedelta
 
 
+STORAGE_STRATEGIES = ['pandas', 'sqlite', 'dict']
+
+# Precomputed 'Mon 2023' labels indexed by month offset
+MONTH_YEAR_LABELS = np.array([
+    f"{month} 2023" for month in
+    ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+])
+
 def create_sample_financial_data(size: int = 10000) -> pd.DataFrame:
     """Create sample financial data for testing."""
     print(f"Creating sample financial data with {size:,} records...")
     
     np.random.seed(42)  # For reproducible results
     
-    # Generate sample data
+    # Generate sample data column-wise with typed NumPy arrays
+    ids = np.arange(1, size + 1)
+    id_strings = ids.astype(str)
     data = {
-        'transaction_id': range(1, size + 1),
+        'transaction_id': ids,
         'date': pd.date_range(start='2023-01-01', periods=size, freq='D'),
         'account_name': np.random.choice(['Cash', 'Accounts Receivable', 'Inventory', 'Equipment'], size),
-        'description': [f'Transaction {i}' for i in range(1, size + 1)],
+        'description': np.char.add('Transaction ', id_strings),
         'amount': np.random.normal(1000, 500, size),
         'currency': np.random.choice(['USD', 'EUR', 'GBP'], size),
         'category': np.random.choice(['Revenue', 'Expense', 'Asset', 'Liability'], size),
-        'reference': [f'REF-{i:06d}' for i in range(1, size + 1)]
+        'reference': np.char.add('REF-', np.char.zfill(id_strings, 6))
     }
     
-    # Add some formatted amounts
-    data['formatted_amount'] = [
-        f"${abs(amt):,.2f}" if amt >= 0 else f"({abs(amt):,.2f})"
-        for amt in data['amount']
-    ]
+    # Add some formatted amounts ($1,234.56 for positive, (1,234.56) for negative)
+    abs_amounts = pd.Series(np.char.mod('%.2f', np.abs(data['amount'])))
+    abs_amounts = abs_amounts.str.replace(r'(\d)(?=(\d{3})+\.)', r'\1,', regex=True).to_numpy(dtype=str)
+    data['formatted_amount'] = np.where(
+        data['amount'] >= 0,
+        np.char.add('$', abs_amounts),
+        np.char.add(np.char.add('(', abs_amounts), ')')
+    )
     
     # Add some date variations
-    data['quarter'] = [f"Q{(i % 4) + 1} 2023" for i in range(size)]
-    data['month_year'] = [f"{datetime(2023, (i % 12) + 1, 1).strftime('%b %Y')}" for i in range(size)]
+    positions = np.arange(size)
+    data['quarter'] = np.char.add(np.char.add('Q', (positions % 4 + 1).astype(str)), ' 2023')
+    data['month_year'] = MONTH_YEAR_LABELS[positions % 12]
+    
+    # Store low-cardinality text columns as categoricals (1-byte codes per row)
+    for column in ('account_name', 'currency', 'category'):
+        codes, uniques = pd.factorize(data[column])
+        data[column] = pd.Categorical.from_codes(codes, uniques)
+    
+    # Downcast numeric columns to the smallest dtype that holds them
+    data['transaction_id'] = pd.to_numeric(data['transaction_id'], downcast='unsigned')
+    data['amount'] = pd.to_numeric(data['amount'], downcast='float')
     
     df = pd.DataFrame(data)
     print(f"✅ Created sample data: {df.shape}")
     return df
 
 
+def warm_up_storage_strategies(df: pd.DataFrame, storage_strategies: list):
+    """Run each storage strategy once on a tiny slice so one-time setup costs aren't timed."""
+    warm_df = df.head(16)
+    for strategy in storage_strategies:
+        storage = DataStorage(storage_type=strategy)
+        dataset_id = storage.store_data(warm_df, {})
+        storage.query_by_criteria({'currency': 'USD'}, dataset_id)
+        storage.aggregate_data(['currency'], ['amount:sum'], dataset_id)
+
+
 def benchmark_storage_strategies(df: pd.DataFrame):
-    """Benchmark different storage strategies."""
+    """
+    Benchmark different storage strategies.
+    
+    The loaded storages are returned so the query and aggregation benchmarks
+    reuse them instead of ingesting the data again.
+    """
     print("\n=== Storage Strategy Benchmarking ===")
     print("=" * 50)
     
-    storage_strategies = ['pandas', 'sqlite', 'dict']
     results = {}
+    storages = {}
+    warm_up_storage_strategies(df, STORAGE_STRATEGIES)
     
-    for strategy in storage_strategies:
+    for strategy in STORAGE_STRATEGIES:
         print(f"\n📊 Testing {strategy.upper()} storage strategy...")
         
         # Measure storage performance
@@ -73,28 +112,32 @@ def benchmark_storage_strategies(df: pd.DataFrame):
             dataset_id = storage.store_data(df, {'source': 'sample', 'strategy': strategy})
             return storage, dataset_id
         
-        metrics = calculate_performance_metrics(store_data)
+        metrics, (storage, dataset_id) = calculate_performance_metrics(store_data, return_value=True)
         results[strategy] = metrics
         
+        if strategy == 'sqlite':
+            # Index the columns used by the query and aggregation benchmarks
+            storage.create_indexes(['category', 'currency', 'amount'], dataset_id)
+        storages[strategy] = (storage, dataset_id)
+        
         print(f"   ⏱️  Storage time: {metrics['execution_time_seconds']:.4f}s")
         print(f"   💾 Memory used: {metrics['memory_used_mb']:.2f} MB")
         print(f"   📈 Final memory: {metrics['final_memory_mb']:.2f} MB")
     
     # Compare results
-    print("\n📊 Storage Strategy Comparison:")
-    print("-" * 40)
+    lines = ["\n📊 Storage Strategy Comparison:", "-" * 40]
     for strategy, metrics in results.items():
-        print(f"{strategy.upper():>10}: {metrics['execution_time_seconds']:>8.4f}s | {metrics['memory_used_mb']:>8.2f}MB")
+        lines.append(f"{strategy.upper():>10}: {metrics['execution_time_seconds']:>8.4f}s | {metrics['memory_used_mb']:>8.2f}MB")
+    print("\n".join(lines))
     
-    return results
+    return results, storages
 
 
-def benchmark_query_performance(df: pd.DataFrame):
+def benchmark_query_performance(storages: dict):
     """Benchmark query performance across storage strategies."""
     print("\n=== Query Performance Benchmarking ===")
     print("=" * 50)
     
-    storage_strategies = ['pandas', 'sqlite', 'dict']
     query_results = {}
     
     # Define test queries
@@ -125,21 +168,16 @@ def benchmark_query_performance(df: pd.DataFrame):
         }
     ]
     
-    for strategy in storage_strategies:
+    for strategy, (storage, dataset_id) in storages.items():
         print(f"\n🔍 Testing {strategy.upper()} query performance...")
         
-        # Initialize storage
-        storage = DataStorage(storage_type=strategy)
-        dataset_id = storage.store_data(df, {'source': 'sample', 'strategy': strategy})
-        
         strategy_results = {}
         
         for query in test_queries:
             def run_query():
                 return storage.query_by_criteria(query['filters'], dataset_id)
             
-            metrics = calculate_performance_metrics(run_query)
-            result_df = run_query()
+            metrics, result_df = calculate_performance_metrics(run_query, return_value=True)
             
             strategy_results[query['name']] = {
                 'execution_time': metrics['execution_time_seconds'],
@@ -148,27 +186,28 @@ def benchmark_query_performance(df: pd.DataFrame):
             }
             
             print(f"   {query['name']}: {metrics['execution_time_seconds']:.4f}s ({len(result_df)} results)")
+            for step in storage.explain_query(query['filters'], dataset_id):
+                print(f"      Plan: {step}")
         
         query_results[strategy] = strategy_results
     
     # Compare query performance
-    print("\n📊 Query Performance Comparison:")
-    print("-" * 60)
-    for query_name in test_queries:
-        print(f"\n{query_name['name']}:")
-        for strategy in storage_strategies:
-            result = query_results[strategy][query_name]
-            print(f"  {strategy.upper():>10}: {result['execution_time']:>8.4f}s | {result['result_count']:>6} results")
+    lines = ["\n📊 Query Performance Comparison:", "-" * 60]
+    for query in test_queries:
+        lines.append(f"\n{query['name']}:")
+        for strategy in storages:
+            result = query_results[strategy][query['name']]
+            lines.append(f"  {strategy.upper():>10}: {result['execution_time']:>8.4f}s | {result['result_count']:>6} results")
+    print("\n".join(lines))
     
     return query_results
 
 
-def benchmark_aggregation_performance(df: pd.DataFrame):
+def benchmark_aggregation_performance(storages: dict):
     """Benchmark aggregation performance."""
     print("\n=== Aggregation Performance Benchmarking ===")
     print("=" * 50)
     
-    storage_strategies = ['pandas', 'sqlite', 'dict']
     agg_results = {}
     
     # Define test aggregations
@@ -195,21 +234,16 @@ def benchmark_aggregation_performance(df: pd.DataFrame):
         }
     ]
     
-    for strategy in storage_strategies:
+    for strategy, (storage, dataset_id) in storages.items():
         print(f"\n📊 Testing {strategy.upper()} aggregation performance...")
         
-        # Initialize storage
-        storage = DataStorage(storage_type=strategy)
-        dataset_id = storage.store_data(df, {'source': 'sample', 'strategy': strategy})
-        
         strategy_results = {}
         
         for agg in test_aggregations:
             def run_aggregation():
                 return storage.aggregate_data(agg['group_by'], agg['measures'], dataset_id)
             
-            metrics = calculate_performance_metrics(run_aggregation)
-            result_df = run_aggregation()
+            metrics, result_df = calculate_performance_metrics(run_aggregation, return_value=True)
             
             strategy_results[agg['name']] = {
                 'execution_time': metrics['execution_time_seconds'],
@@ -222,13 +256,13 @@ def benchmark_aggregation_performance(df: pd.DataFrame):
         agg_results[strategy] = strategy_results
     
     # Compare aggregation performance
-    print("\n📊 Aggregation Performance Comparison:")
-    print("-" * 60)
-    for agg_name in test_aggregations:
-        print(f"\n{agg_name['name']}:")
-        for strategy in storage_strategies:
-            result = agg_results[strategy][agg_name]
-            print(f"  {strategy.upper():>10}: {result['execution_time']:>8.4f}s | {result['result_count']:>6} groups")
+    lines = ["\n📊 Aggregation Performance Comparison:", "-" * 60]
+    for agg in test_aggregations:
+        lines.append(f"\n{agg['name']}:")
+        for strategy in storages:
+            result = agg_results[strategy][agg['name']]
+            lines.append(f"  {strategy.upper():>10}: {result['execution_time']:>8.4f}s | {result['result_count']:>6} groups")
+    print("\n".join(lines))
     
     return agg_results
 
@@ -307,7 +341,7 @@ def demonstrate_data_quality_analysis(df: pd.DataFrame):
             print(f"   • {rec}")
     
     # Create detailed summary report
-    summary = create_summary_report(df, "Financial Data Quality Analysis")
+    summary = create_summary_report(df, "Financial Data Quality Analysis", deep=True)
     
     print(f"\n📈 Data Summary:")
     print(f"   Rows: {summary['basic_info']['rows']:,}")
@@ -325,9 +359,10 @@ def main():
     sample_df = create_sample_financial_data(10000)
     
     # Run benchmarks
-    storage_results = benchmark_storage_strategies(sample_df)
-    query_results = benchmark_query_performance(sample_df)
-    agg_results = benchmark_aggregation_performance(sample_df)
+    # Ingest once per strategy, then reuse the storages for queries and aggregations
+    storage_results, storages = benchmark_storage_strategies(sample_df)
+    query_results = benchmark_query_performance(storages)
+    agg_results = benchmark_aggregation_performance(storages)
     
     # Demonstrate advanced features
     demonstrate_indexing_benefits(sample_df)
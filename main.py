@@ -1,5 +1,6 @@
 import os
 import sys
+import argparse
 import pandas as pd
 from src.core.excel_processor import ExcelProcessor
 from src.core.type_detector import DataTypeDetector
@@ -95,13 +96,31 @@ def print_header(title):
     print(title)
     print("=" * 60)
 
-def main():
+# Type detection looks at no more than this many non-null values per column by default
+TYPE_SAMPLE_SIZE = 200000
+
+def detect_sheet_types(type_detector, type_cache, file_path, sheet, df, sample_size=TYPE_SAMPLE_SIZE):
+    """Return type detection results per column, reusing results cached by (file, sheet, column)."""
+    results = {}
+    for col in df.columns:
+        key = (file_path, sheet, col)
+        if key not in type_cache:
+            # analyze_column ignores nulls, so the first non-null values are a faithful sample
+            series = df[col]
+            if len(series) > sample_size:
+                series = series.dropna().head(sample_size)
+            type_cache[key] = type_detector.analyze_column(series)
+        results[col] = type_cache[key]
+    return results
+
+def main(type_sample_size=TYPE_SAMPLE_SIZE):
     excel_processor = ExcelProcessor()
     type_detector = DataTypeDetector()
     format_parser = FormatParser()
     data_storage = DataStorage()
     loaded_files = []
     dataset_ids = []
+    type_cache = {}  # (file_path, sheet, column) -> type detection result
 
     while True:
         print(MENU)
@@ -116,6 +135,8 @@ def main():
             try:
                 file_info = excel_processor.load_files(file_paths)
                 loaded_files = list(file_info.keys())
+                # Reloaded files may have changed on disk
+                type_cache = {key: value for key, value in type_cache.items() if key[0] not in file_info}
                 print(f"Loaded files: {loaded_files}")
             except Exception as e:
                 print(f"Error loading files: {e}")
@@ -140,8 +161,8 @@ def main():
                 print("No files loaded. Please load files first.")
                 continue
             for file_path in loaded_files:
-                sheet_info = excel_processor.get_sheet_info(file_path)
-                for sheet in sheet_info:
+                # Only sheet names are needed here; get_sheet_info would scan every row
+                for sheet in excel_processor.get_sheet_names(file_path):
                     print(f"\nFile: {file_path}, Sheet: {sheet}")
                     try:
                         df = excel_processor.preview_data(file_path, sheet, rows=5)
@@ -157,8 +178,9 @@ def main():
                 all_sheets = excel_processor.get_all_sheets_data(file_path)
                 for sheet, df in all_sheets.items():
                     print(f"\nFile: {file_path}, Sheet: {sheet}")
-                    for col in df.columns:
-                        result = type_detector.analyze_column(df[col])
+                    column_types = detect_sheet_types(type_detector, type_cache, file_path, sheet, df,
+                                                      type_sample_size)
+                    for col, result in column_types.items():
                         print(f"  Column: {col} => Type: {result['type']}, Confidence: {result['confidence']:.2f}")
         elif choice == '5':
             print_header("Parse Sample Amounts/Dates")
@@ -181,7 +203,8 @@ def main():
                 all_sheets = excel_processor.get_all_sheets_data(file_path)
                 for sheet, df in all_sheets.items():
                     # Use type detection for metadata
-                    metadata = {col: type_detector.analyze_column(df[col]) for col in df.columns}
+                    metadata = detect_sheet_types(type_detector, type_cache, file_path, sheet, df,
+                                                  type_sample_size)
                     ds_id = data_storage.store_data(df, metadata)
                     dataset_ids.append(ds_id)
                     print(f"Stored dataset: {ds_id} (File: {file_path}, Sheet: {sheet})")
@@ -199,7 +222,13 @@ def main():
             val = input("Enter value to match: ").strip()
             filters = {col: val}
             try:
-                result = data_storage.query_by_criteria(filters, ds_id)
+                # Only a preview is shown, so stop fetching once enough rows have arrived
+                preview = []
+                for chunk in data_storage.query_by_criteria(filters, ds_id, stream=True):
+                    preview.append(chunk)
+                    if sum(len(part) for part in preview) >= 5:
+                        break
+                result = pd.concat(preview, ignore_index=True) if preview else pd.DataFrame()
                 print(result.head())
             except Exception as e:
                 print(f"Error querying data: {e}")
@@ -231,4 +260,8 @@ def main():
             print("Invalid option. Please try again.")
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Financial Data Parser interactive menu")
+    parser.add_argument("--type-sample-size", type=int, default=TYPE_SAMPLE_SIZE,
+                        help="maximum non-null values per column used for type detection")
+    args = parser.parse_args()
+    main(args.type_sample_size) 
\ No newline at end of file
@@ -1,9 +1,85 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional, Union
+from typing import Dict, List, Tuple, Any, Optional, Union, Iterator
 import sqlite3
 from datetime import datetime, date
+from functools import lru_cache
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import json
+import hashlib
+
+
+# Copy-on-Write is always on from pandas 3.0; older versions have it only if the caller enables it
+_PANDAS_HAS_DEFAULT_COW = int(pd.__version__.split('.')[0]) >= 3
+
+# Rows fetched per chunk when streaming SQLite query results
+_SQLITE_CHUNK_SIZE = 50000
+
+# Maximum number of aggregation results kept per storage instance
+_AGGREGATION_CACHE_SIZE = 128
+
+# Upper bound on worker threads used for all-datasets queries and aggregations
+_MAX_DATASET_WORKERS = 8
+
+# SQLite datasets with the same columns share one table; this column tells their rows apart
+_SQLITE_DATASET_COLUMN = '_dataset_id'
+
+
+@lru_cache(maxsize=256)
+def _sqlite_select_sql(table_name: str, columns: Tuple[str, ...],
+                       shape: Tuple[Tuple[str, str, int], ...]) -> str:
+    """
+    Build the parameterized SELECT for a filter shape.
+    
+    Identical shapes return the identical SQL string, so SQLite's statement
+    cache can reuse the prepared statement across queries.
+    
+    Args:
+        table_name: Table to select from
+        columns: Dataset columns to return
+        shape: Tuple of (column, kind, value count) per filter
+        
+    Returns:
+        SQL string with ? placeholders, the first one binding the dataset id
+    """
+    where_conditions = [f"{_quote_identifier(_SQLITE_DATASET_COLUMN)} = ?"]
+    for column, kind, count in shape:
+        column = _quote_identifier(column)
+        if kind == 'between':
+            where_conditions.append(f"{column} BETWEEN ? AND ?")
+        elif kind == 'min':
+            where_conditions.append(f"{column} >= ?")
+        elif kind == 'max':
+            where_conditions.append(f"{column} <= ?")
+        elif kind == 'in':
+            where_conditions.append(f"{column} IN ({','.join('?' * count)})")
+        else:
+            where_conditions.append(f"{column} = ?")
+    
+    select = ", ".join(_quote_identifier(column) for column in columns)
+    where_clause = " AND ".join(where_conditions)
+    return f"SELECT {select} FROM {_quote_identifier(table_name)} WHERE {where_clause}"
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a SQLite identifier, escaping embedded double quotes."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _copy_on_write_enabled() -> bool:
+    """Whether pandas shares copied data until one side writes to it."""
+    return _PANDAS_HAS_DEFAULT_COW or pd.get_option('mode.copy_on_write') is True
+
+
+def _sqlite_param(value: Any) -> Any:
+    """Convert a filter value to a type sqlite3 can bind."""
+    if isinstance(value, (datetime, date)):
+        # Matches the text form pandas.to_sql writes for datetime columns
+        return str(value)
+    if isinstance(value, np.generic):
+        return value.item()
+    return value
 
 
 class DataStorage:
@@ -11,42 +87,65 @@ class DataStorage:
     Optimized data storage system with fast lookup capabilities and efficient querying.
     """
     
-    def __init__(self, storage_type: str = 'pandas'):
+    def __init__(self, storage_type: str = 'pandas', categorize_threshold: float = 0.5):
         """
         Initialize data storage system.
         
         Args:
             storage_type: Type of storage ('pandas', 'sqlite', 'dict')
+            categorize_threshold: Pandas storage converts string columns whose unique-value
+                ratio is below this threshold to categorical (0 disables the conversion)
         """
         self.storage_type = storage_type
+        self.categorize_threshold = categorize_threshold
+        
         self.data = {}
         self.indexes = {}
         self.metadata = {}
         
+        # Aggregation results keyed by dataset versions and the requested grouping, LRU-evicted
+        self._versions: Dict[str, int] = {}
+        self._agg_cache: OrderedDict = OrderedDict()
+        
+        # Materialized frames for SQLite tables; an entry is dropped whenever its table is (re)written
+        self._frame_cache: Dict[str, pd.DataFrame] = {}
+        
+        # Column names and datetime columns (stored as text by to_sql) per SQLite dataset
+        self._sqlite_columns: Dict[str, Tuple[str, ...]] = {}
+        self._datetime_columns: Dict[str, set] = {}
+        
         if storage_type == 'sqlite':
             self.db_connection = sqlite3.connect(':memory:')
+            self._configure_sqlite_connection()
             self._create_tables()
     
-    def store_data(self, dataframe: pd.DataFrame, metadata: Dict[str, Any]) -> str:
+    def store_data(self, dataframe: pd.DataFrame, metadata: Dict[str, Any],
+                   copy: Optional[bool] = None) -> str:
         """
         Store data with metadata and create indexes for fast lookup.
         
         Args:
             dataframe: DataFrame to store
             metadata: Metadata about the data (column types, source, etc.)
+            copy: Deep-copy the frame (True) or share its column data (False). By default
+                the data is shared only while Copy-on-Write is active (always on pandas 3,
+                opt-in through mode.copy_on_write before that) and deep-copied otherwise
             
         Returns:
             Dataset identifier
         """
         dataset_id = f"dataset_{len(self.data)}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        if copy is None:
+            copy = not _copy_on_write_enabled()
         
         if self.storage_type == 'pandas':
-            self._store_pandas_data(dataset_id, dataframe, metadata)
+            self._store_pandas_data(dataset_id, dataframe, metadata, copy)
         elif self.storage_type == 'sqlite':
             self._store_sqlite_data(dataset_id, dataframe, metadata)
         elif self.storage_type == 'dict':
-            self._store_dict_data(dataset_id, dataframe, metadata)
+            self._store_dict_data(dataset_id, dataframe, metadata, copy)
         
+        self._versions[dataset_id] = self._versions.get(dataset_id, 0) + 1
         return dataset_id
     
     def create_indexes(self, columns: List[str], dataset_id: Optional[str] = None) -> Dict[str, Any]:
@@ -80,25 +179,31 @@ class DataStorage:
         
         return index_info
     
-    def query_by_criteria(self, filters: Dict[str, Any], dataset_id: Optional[str] = None) -> pd.DataFrame:
+    def query_by_criteria(self, filters: Dict[str, Any], dataset_id: Optional[str] = None,
+                          stream: bool = False) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
         """
         Query data using various criteria with support for range queries.
         
         Args:
             filters: Dictionary with filter criteria
             dataset_id: Specific dataset to query (if None, queries all datasets)
+            stream: Return an iterator of result chunks instead of one DataFrame; SQLite
+                results are then fetched in bounded chunks
             
         Returns:
-            DataFrame with filtered results
+            DataFrame with filtered results, or an iterator of DataFrames when streaming
         """
+        if stream:
+            return self._iter_query_chunks(filters, dataset_id)
+        
         if dataset_id is None:
-            # Query all datasets
-            results = []
-            for ds_id in self.data.keys():
-                result = self._query_dataset(ds_id, filters)
-                if not result.empty:
-                    result['dataset_id'] = ds_id
-                    results.append(result)
+            # Query all datasets, tagging each result inside its worker
+            results = [
+                result for result in self._map_datasets(
+                    lambda ds_id: self._query_dataset(ds_id, filters).assign(dataset_id=ds_id)
+                )
+                if not result.empty
+            ]
             
             if results:
                 return pd.concat(results, ignore_index=True)
@@ -107,18 +212,54 @@ class DataStorage:
         else:
             return self._query_dataset(dataset_id, filters)
     
+    def explain_query(self, filters: Dict[str, Any], dataset_id: str) -> List[str]:
+        """
+        Show how SQLite would execute a filter query (useful to verify index usage).
+        
+        Args:
+            filters: Dictionary with filter criteria
+            dataset_id: Dataset to query
+            
+        Returns:
+            List of query plan steps (empty for non-SQLite storage)
+        """
+        if self.storage_type != 'sqlite' or dataset_id not in self.data:
+            return []
+        
+        query, params = self._build_sqlite_query(dataset_id, filters)
+        plan = self.db_connection.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        return [row[-1] for row in plan]
+    
     def aggregate_data(self, group_by: List[str], measures: List[str], dataset_id: Optional[str] = None) -> pd.DataFrame:
         """
         Aggregate data by specified columns with various measures.
         """
+        versions = tuple(self._versions.items()) if dataset_id is None else self._versions.get(dataset_id)
+        cache_key = (dataset_id, versions, tuple(group_by), tuple(measures))
+        if cache_key in self._agg_cache:
+            self._agg_cache.move_to_end(cache_key)
+            return self._agg_cache[cache_key].copy()
+        
+        result = self._aggregate_uncached(group_by, measures, dataset_id)
+        if not result.empty:
+            self._agg_cache[cache_key] = result
+            if len(self._agg_cache) > _AGGREGATION_CACHE_SIZE:
+                self._agg_cache.popitem(last=False)
+            # Aggregates are small, so callers get deep copies they can change in place
+            result = result.copy()
+        return result
+    
+    def _aggregate_uncached(self, group_by: List[str], measures: List[str],
+                            dataset_id: Optional[str] = None) -> pd.DataFrame:
+        """Aggregate stored data without consulting the result cache."""
         if dataset_id is None:
             # Aggregate all datasets
-            all_data = []
-            for ds_id in self.data.keys():
-                df = self._get_dataset_data(ds_id)
-                if not df.empty:
-                    df['dataset_id'] = ds_id
-                    all_data.append(df)
+            all_data = [
+                df for df in self._map_datasets(
+                    lambda ds_id: self._get_dataset_data(ds_id).assign(dataset_id=ds_id)
+                )
+                if not df.empty
+            ]
             if all_data:
                 combined_df = pd.concat(all_data, ignore_index=True)
                 return self._perform_aggregation(combined_df, group_by, measures)
@@ -127,9 +268,32 @@ class DataStorage:
                 print("No data available to aggregate.")
                 return pd.DataFrame()
         else:
+            if self.storage_type == 'sqlite' and dataset_id in self.data:
+                result = self._aggregate_sqlite_data(dataset_id, group_by, measures)
+                if result is not None:
+                    return result
             df = self._get_dataset_data(dataset_id)
             return self._perform_aggregation(df, group_by, measures)
     
+    def _map_datasets(self, func) -> List[Any]:
+        """
+        Apply a function to every stored dataset id, in worker threads where possible.
+        
+        SQLite storage stays sequential because its connection belongs to the creating thread.
+        
+        Args:
+            func: Callable taking a dataset id
+            
+        Returns:
+            List of results in dataset order
+        """
+        dataset_ids = list(self.data.keys())
+        if self.storage_type == 'sqlite' or len(dataset_ids) < 2:
+            return [func(ds_id) for ds_id in dataset_ids]
+        
+        with ThreadPoolExecutor(max_workers=min(_MAX_DATASET_WORKERS, len(dataset_ids))) as executor:
+            return list(executor.map(func, dataset_ids))
+    
     def get_dataset_info(self, dataset_id: str) -> Dict[str, Any]:
         """
         Get information about a specific dataset.
@@ -156,28 +320,63 @@ class DataStorage:
             'storage_type': self.storage_type
         }
     
-    def _store_pandas_data(self, dataset_id: str, dataframe: pd.DataFrame, metadata: Dict[str, Any]):
+    def _store_pandas_data(self, dataset_id: str, dataframe: pd.DataFrame, metadata: Dict[str, Any],
+                           copy: bool = False):
         """Store data using pandas DataFrame."""
-        self.data[dataset_id] = dataframe.copy()
+        # A shallow copy shares column data; Copy-on-Write copies a block only if either side mutates it
+        df = dataframe.copy(deep=copy)
+        
+        # Low-cardinality string columns filter and group on integer codes as categoricals
+        if len(df) > 0:
+            for column in df.select_dtypes(include=['object', 'string']).columns:
+                if df[column].nunique(dropna=False) / len(df) < self.categorize_threshold:
+                    df[column] = df[column].astype('category')
+        
+        self.data[dataset_id] = df
         self.metadata[dataset_id] = metadata
         self.indexes[dataset_id] = {}
     
     def _store_sqlite_data(self, dataset_id: str, dataframe: pd.DataFrame, metadata: Dict[str, Any]):
         """Store data using SQLite database."""
-        table_name = f"table_{dataset_id}"
-        dataframe.to_sql(table_name, self.db_connection, if_exists='replace', index=False)
+        # Datasets with the same columns and declared SQL types append to one shared table,
+        # keyed by a schema signature; a differently typed dataset would otherwise be coerced
+        # by the first dataset's column affinities (e.g. '00123' read back as 123)
+        columns = tuple(str(column) for column in dataframe.columns)
+        rows = dataframe.set_axis(list(columns), axis=1).assign(**{_SQLITE_DATASET_COLUMN: dataset_id})
+        schema = pd.io.sql.get_schema(rows, 'records', con=self.db_connection)
+        signature = hashlib.blake2b(schema.encode(), digest_size=8).hexdigest()
+        table_name = f"records_{signature}"
+        
+        table_exists = self.db_connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table_name,)
+        ).fetchone()
+        rows.to_sql(table_name, self.db_connection, if_exists='append', index=False)
+        if not table_exists:
+            self.db_connection.execute(
+                f"CREATE INDEX {_quote_identifier(f'idx_{table_name}_dataset')} "
+                f"ON {_quote_identifier(table_name)} ({_quote_identifier(_SQLITE_DATASET_COLUMN)})"
+            )
+        
+        self._frame_cache.pop(dataset_id, None)
+        self._sqlite_columns[dataset_id] = columns
+        self._datetime_columns[dataset_id] = {
+            column for column in dataframe.columns
+            if pd.api.types.is_datetime64_any_dtype(dataframe[column])
+        }
         
         self.data[dataset_id] = table_name
         self.metadata[dataset_id] = metadata
         self.indexes[dataset_id] = {}
     
-    def _store_dict_data(self, dataset_id: str, dataframe: pd.DataFrame, metadata: Dict[str, Any]):
+    def _store_dict_data(self, dataset_id: str, dataframe: pd.DataFrame, metadata: Dict[str, Any],
+                         copy: bool = False):
         """Store data using dictionary structure."""
-        # Convert DataFrame to dictionary format
+        # Column-major dictionary format: one array per column instead of one dict per row;
+        # a shallow copy shares column data under Copy-on-Write
         data_dict = {
-            'records': dataframe.to_dict('records'),
             'columns': list(dataframe.columns),
-            'dtypes': dataframe.dtypes.to_dict()
+            'dtypes': dataframe.dtypes.to_dict(),
+            'frame': dataframe.copy(deep=copy)
         }
         
         self.data[dataset_id] = data_dict
@@ -191,26 +390,44 @@ class DataStorage:
         
         for column in columns:
             if column in df.columns:
-                # Create sorted index for fast lookup
+                if isinstance(df[column].dtype, pd.CategoricalDtype):
+                    # Categorical codes already act as an index; equality filters compare codes directly
+                    index_info[column] = {
+                        'type': 'categorical',
+                        'via': 'codes',
+                        'unique_values': df[column].cat.categories.to_numpy()
+                    }
+                    continue
+                
+                # One factorize pass yields the uniques, their counts and their row positions
+                codes, uniques = pd.factorize(df[column], use_na_sentinel=False)
+                counts = np.bincount(codes, minlength=len(uniques))
+                has_value = ~np.asarray(pd.isna(uniques))
+                value_counts = dict(zip(uniques[has_value], counts[has_value].tolist()))
+                
+                # Create sorted index for fast lookup; only the small uniques array is sorted
                 try:
-                    sorted_values = df[column].sort_values()
-                    unique_values = sorted_values.unique()
-                    value_counts = df[column].value_counts().to_dict()
                     index_info[column] = {
                         'type': 'sorted_index',
-                        'unique_values': unique_values,
+                        'unique_values': uniques.sort_values().to_numpy(),
                         'value_counts': value_counts
                     }
                 except TypeError:
                     # Fallback for mixed/unorderable types
-                    unique_values = df[column].unique()
-                    value_counts = df[column].value_counts().to_dict()
                     index_info[column] = {
                         'type': 'unsorted_index',
-                        'unique_values': unique_values,
+                        'unique_values': uniques.to_numpy(),
                         'value_counts': value_counts,
                         'warning': 'Could not sort values due to mixed or unorderable types.'
                     }
+                
+                # Hash index of row positions for equality and 'in' filters; datetime
+                # columns are left out since they are filtered by parsed string bounds
+                if not pd.api.types.is_datetime64_any_dtype(df[column]):
+                    groups = np.split(np.argsort(codes, kind='stable'), np.cumsum(counts)[:-1])
+                    index_info[column]['positions'] = {
+                        value: group for value, group, keep in zip(uniques, groups, has_value) if keep
+                    }
         
         self.indexes[dataset_id].update(index_info)
         return index_info
@@ -218,21 +435,34 @@ class DataStorage:
     def _create_sqlite_indexes(self, dataset_id: str, columns: List[str]) -> Dict[str, Any]:
         """Create indexes for SQLite storage."""
         table_name = self.data[dataset_id]
+        table_columns = set(self._sqlite_columns[dataset_id])
         index_info = {}
         
-        for column in columns:
-            index_name = f"idx_{table_name}_{column}"
-            try:
-                self.db_connection.execute(f"CREATE INDEX {index_name} ON {table_name} ({column})")
+        # One transaction for the whole batch; only real table columns reach the SQL
+        with self.db_connection:
+            self.db_connection.execute("BEGIN")
+            for column in columns:
+                if column not in table_columns:
+                    index_info[column] = {
+                        'type': 'sqlite_index',
+                        'error': f"no such column: {column}"
+                    }
+                    continue
+                
+                # Lead with the dataset column, since every query on the shared table filters on it
+                index_name = f"idx_{table_name}_{column}"
+                self.db_connection.execute(
+                    f"CREATE INDEX IF NOT EXISTS {_quote_identifier(index_name)} ON {_quote_identifier(table_name)} "
+                    f"({_quote_identifier(_SQLITE_DATASET_COLUMN)}, {_quote_identifier(column)})"
+                )
                 index_info[column] = {
                     'type': 'sqlite_index',
                     'index_name': index_name
                 }
-            except Exception as e:
-                index_info[column] = {
-                    'type': 'sqlite_index',
-                    'error': str(e)
-                }
+        
+        # Gather statistics so the planner can pick between the new indexes
+        if any('index_name' in info for info in index_info.values()):
+            self.db_connection.execute(f"ANALYZE {_quote_identifier(table_name)}")
         
         self.indexes[dataset_id].update(index_info)
         return index_info
@@ -240,18 +470,13 @@ class DataStorage:
     def _create_dict_indexes(self, dataset_id: str, columns: List[str]) -> Dict[str, Any]:
         """Create indexes for dictionary storage."""
         data_dict = self.data[dataset_id]
-        records = data_dict['records']
+        frame = data_dict['frame']
         index_info = {}
         
         for column in columns:
             if column in data_dict['columns']:
-                # Create value-based index
-                value_index = {}
-                for i, record in enumerate(records):
-                    value = record.get(column)
-                    if value not in value_index:
-                        value_index[value] = []
-                    value_index[value].append(i)
+                # Create value-based index: value -> array of record positions, grouped in one hash pass
+                value_index = frame.groupby(column, sort=False, dropna=False, observed=True).indices
                 
                 index_info[column] = {
                     'type': 'dict_index',
@@ -277,102 +502,180 @@ class DataStorage:
         """Query pandas DataFrame with filters."""
         df = self.data[dataset_id]
         
+        # Resolve indexed equality/'in' filters to row positions before scanning the rest
+        positions, filters = self._lookup_indexed_positions(dataset_id, filters)
+        if positions is not None:
+            df = df.take(positions)
+        
+        # AND every remaining filter into one mask so the frame is sliced only once
+        mask = np.ones(len(df), dtype=bool)
         for column, condition in filters.items():
             if column not in df.columns:
                 continue
             
             if isinstance(condition, dict):
-                # Range query
+                # Range query; unordered categoricals compare on their underlying values
+                values = df[column]
+                if isinstance(values.dtype, pd.CategoricalDtype) and not values.cat.ordered:
+                    values = values.astype(values.cat.categories.dtype)
                 if 'min' in condition and 'max' in condition:
-                    df = df[(df[column] >= condition['min']) & (df[column] <= condition['max'])]
+                    mask &= ((values >= condition['min']) & (values <= condition['max'])).to_numpy()
                 elif 'min' in condition:
-                    df = df[df[column] >= condition['min']]
+                    mask &= (values >= condition['min']).to_numpy()
                 elif 'max' in condition:
-                    df = df[df[column] <= condition['max']]
+                    mask &= (values <= condition['max']).to_numpy()
                 elif 'in' in condition:
-                    df = df[df[column].isin(condition['in'])]
+                    mask &= df[column].isin(condition['in']).to_numpy()
             else:
                 # Exact match
-                df = df[df[column] == condition]
+                mask &= self._equality_mask(df[column], condition)
         
-        return df
+        return df if mask.all() else df[mask]
+    
+    def _lookup_indexed_positions(self, dataset_id: str,
+                                  filters: Dict[str, Any]) -> Tuple[Optional[np.ndarray], Dict[str, Any]]:
+        """
+        Answer equality and 'in' filters from hash indexes built by create_indexes.
+        
+        Args:
+            dataset_id: Dataset being queried
+            filters: Dictionary with filter criteria
+            
+        Returns:
+            Tuple of the sorted row positions matching every indexed filter (None when
+            no filter could use an index) and the filters still left to evaluate
+        """
+        indexes = self.indexes.get(dataset_id, {})
+        positions = None
+        remaining = {}
+        
+        for column, condition in filters.items():
+            index = indexes.get(column, {}).get('positions')
+            if isinstance(condition, dict):
+                values = condition['in'] if set(condition) == {'in'} else None
+            else:
+                values = [condition] if pd.api.types.is_scalar(condition) and not pd.isna(condition) else None
+            
+            if index is None or values is None:
+                remaining[column] = condition
+                continue
+            
+            hits = [index[value] for value in values if value in index]
+            matched = np.unique(np.concatenate(hits)) if hits else np.empty(0, dtype=np.int64)
+            positions = matched if positions is None else np.intersect1d(positions, matched, assume_unique=True)
+        
+        return positions, remaining
+    
+    def _equality_mask(self, series: pd.Series, value: Any) -> np.ndarray:
+        """Build an exact-match mask, comparing integer codes for categorical columns."""
+        if isinstance(series.dtype, pd.CategoricalDtype):
+            categories = series.cat.categories
+            if value not in categories:
+                return np.zeros(len(series), dtype=bool)
+            return series.cat.codes.to_numpy() == categories.get_loc(value)
+        return (series == value).to_numpy()
     
     def _query_sqlite_data(self, dataset_id: str, filters: Dict[str, Any]) -> pd.DataFrame:
         """Query SQLite data with filters."""
-        table_name = self.data[dataset_id]
-        
-        # Build WHERE clause
-        where_conditions = []
+        query, params = self._build_sqlite_query(dataset_id, filters)
+        return pd.read_sql_query(query, self.db_connection, params=params)
+    
+    def _iter_query_chunks(self, filters: Dict[str, Any], dataset_id: Optional[str]) -> Iterator[pd.DataFrame]:
+        """Yield non-empty query results chunk by chunk, tagging rows when querying all datasets."""
+        dataset_ids = list(self.data.keys()) if dataset_id is None else [dataset_id]
+        for ds_id in dataset_ids:
+            if self.storage_type == 'sqlite':
+                query, params = self._build_sqlite_query(ds_id, filters)
+                chunks = pd.read_sql_query(query, self.db_connection, params=params,
+                                           chunksize=_SQLITE_CHUNK_SIZE)
+            else:
+                chunks = [self._query_dataset(ds_id, filters)]
+            
+            for chunk in chunks:
+                if chunk.empty:
+                    continue
+                yield chunk.assign(dataset_id=ds_id) if dataset_id is None else chunk
+    
+    def _build_sqlite_query(self, dataset_id: str, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Build the parameterized SELECT statement and its bound values for a SQLite filter query."""
+        datetime_columns = self._datetime_columns.get(dataset_id, set())
+        table_columns = self._sqlite_columns[dataset_id]
+        shape = []
+        params = []
         for column, condition in filters.items():
+            if column not in table_columns:
+                # Unknown columns are ignored, as in the pandas path; filter keys never
+                # reach the SQL text unless they name a stored column
+                continue
+            
+            first_param = len(params)
             if isinstance(condition, dict):
                 # Range query
                 if 'min' in condition and 'max' in condition:
-                    where_conditions.append(f"{column} BETWEEN {condition['min']} AND {condition['max']}")
+                    shape.append((column, 'between', 2))
+                    params.extend([condition['min'], condition['max']])
                 elif 'min' in condition:
-                    where_conditions.append(f"{column} >= {condition['min']}")
+                    shape.append((column, 'min', 1))
+                    params.append(condition['min'])
                 elif 'max' in condition:
-                    where_conditions.append(f"{column} <= {condition['max']}")
+                    shape.append((column, 'max', 1))
+                    params.append(condition['max'])
                 elif 'in' in condition:
-                    values = ','.join([f"'{v}'" for v in condition['in']])
-                    where_conditions.append(f"{column} IN ({values})")
+                    shape.append((column, 'in', len(condition['in'])))
+                    params.extend(condition['in'])
             else:
                 # Exact match
-                if isinstance(condition, str):
-                    where_conditions.append(f"{column} = '{condition}'")
-                else:
-                    where_conditions.append(f"{column} = {condition}")
-        
-        where_clause = " AND ".join(where_conditions) if where_conditions else "1=1"
-        query = f"SELECT * FROM {table_name} WHERE {where_clause}"
+                shape.append((column, 'eq', 1))
+                params.append(condition)
+            
+            if column in datetime_columns:
+                # Compare against the same text form to_sql wrote for the column
+                params[first_param:] = [pd.Timestamp(value) for value in params[first_param:]]
         
-        return pd.read_sql_query(query, self.db_connection)
+        table_name = self.data[dataset_id]
+        query = _sqlite_select_sql(table_name, self._sqlite_columns[dataset_id], tuple(shape))
+        return query, [dataset_id] + [_sqlite_param(value) for value in params]
     
     def _query_dict_data(self, dataset_id: str, filters: Dict[str, Any]) -> pd.DataFrame:
         """Query dictionary data with filters."""
         data_dict = self.data[dataset_id]
-        records = data_dict['records']
-        
-        filtered_records = []
-        for record in records:
-            match = True
-            for column, condition in filters.items():
-                if column not in record:
-                    match = False
-                    break
-                
-                value = record[column]
-                
-                if isinstance(condition, dict):
-                    # Range query
-                    if 'min' in condition and value < condition['min']:
-                        match = False
-                    elif 'max' in condition and value > condition['max']:
-                        match = False
-                    elif 'in' in condition and value not in condition['in']:
-                        match = False
-                else:
-                    # Exact match
-                    if value != condition:
-                        match = False
-                
-                if not match:
-                    break
+        frame = data_dict['frame']
+        
+        # Evaluate every filter as a vectorized mask over the columnar copy
+        mask = np.ones(len(frame), dtype=bool)
+        for column, condition in filters.items():
+            if column not in frame.columns:
+                return pd.DataFrame()
             
-            if match:
-                filtered_records.append(record)
+            values = frame[column]
+            if isinstance(condition, dict):
+                # Range query
+                if 'min' in condition:
+                    mask &= (values >= condition['min']).to_numpy()
+                if 'max' in condition:
+                    mask &= (values <= condition['max']).to_numpy()
+                if 'in' in condition:
+                    mask &= values.isin(condition['in']).to_numpy()
+            else:
+                # Exact match
+                mask &= self._equality_mask(values, condition)
+            
+            if not mask.any():
+                return pd.DataFrame()
         
-        return pd.DataFrame(filtered_records)
+        return frame[mask].reset_index(drop=True)
     
     def _get_dataset_data(self, dataset_id: str) -> pd.DataFrame:
         """Get DataFrame for a specific dataset."""
         if self.storage_type == 'pandas':
             return self.data[dataset_id]
         elif self.storage_type == 'sqlite':
-            table_name = self.data[dataset_id]
-            return pd.read_sql_query(f"SELECT * FROM {table_name}", self.db_connection)
+            if dataset_id not in self._frame_cache:
+                query, params = self._build_sqlite_query(dataset_id, {})
+                self._frame_cache[dataset_id] = pd.read_sql_query(query, self.db_connection, params=params)
+            return self._frame_cache[dataset_id]
         elif self.storage_type == 'dict':
-            data_dict = self.data[dataset_id]
-            return pd.DataFrame(data_dict['records'])
+            return self.data[dataset_id]['frame']
         else:
             return pd.DataFrame()
     
@@ -388,6 +691,17 @@ class DataStorage:
             print(f"Missing columns for aggregation. Group by: {missing_group}, Measures: {missing_measures}")
             return pd.DataFrame()
         # Define aggregation functions
+        agg_functions = self._parse_measures(measures)
+        # Perform aggregation
+        if group_by:
+            # Categorized key columns would otherwise add empty groups for unseen combinations
+            result = df.groupby(group_by, observed=True).agg(agg_functions).reset_index()
+        else:
+            result = df.agg(agg_functions).to_frame().T
+        return result
+    
+    def _parse_measures(self, measures: List[str]) -> Dict[str, str]:
+        """Map each measure column to its aggregation function ('column:func', default sum)."""
         agg_functions = {}
         for measure in measures:
             if ':' in measure:
@@ -398,12 +712,52 @@ class DataStorage:
                     agg_functions[col_name] = 'sum'  # Default
             else:
                 agg_functions[measure] = 'sum'  # Default
-        # Perform aggregation
+        return agg_functions
+    
+    def _aggregate_sqlite_data(self, dataset_id: str, group_by: List[str],
+                               measures: List[str]) -> Optional[pd.DataFrame]:
+        """
+        Aggregate a SQLite table with GROUP BY so only the reduced result leaves SQLite.
+        
+        Args:
+            dataset_id: Dataset to aggregate
+            group_by: Columns to group by
+            measures: Measures in 'column:func' form
+            
+        Returns:
+            Aggregated DataFrame, or None when the request needs the pandas path
+            (unknown columns, which it reports)
+        """
+        table_name = self.data[dataset_id]
+        table_columns = set(self._sqlite_columns[dataset_id])
+        agg_functions = self._parse_measures(measures)
+        if not agg_functions or not set(group_by) | set(agg_functions) <= table_columns:
+            return None
+        
+        sql_functions = {'sum': 'SUM', 'mean': 'AVG', 'count': 'COUNT', 'min': 'MIN', 'max': 'MAX'}
+        select = [_quote_identifier(column) for column in group_by]
+        for column, agg_func in agg_functions.items():
+            expression = f'{sql_functions[agg_func]}({_quote_identifier(column)})'
+            if agg_func == 'sum':
+                expression = f'COALESCE({expression}, 0)'  # pandas sums all-null groups to 0
+            select.append(f'{expression} AS {_quote_identifier(column)}')
+        
+        # Match pandas groupby: null keys are dropped and groups come out sorted
+        conditions = [f'{_quote_identifier(_SQLITE_DATASET_COLUMN)} = ?']
+        conditions += [f'{_quote_identifier(column)} IS NOT NULL' for column in group_by]
+        query = f'SELECT {", ".join(select)} FROM {_quote_identifier(table_name)} WHERE {" AND ".join(conditions)}'
         if group_by:
-            result = df.groupby(group_by).agg(agg_functions).reset_index()
-        else:
-            result = df.agg(agg_functions).to_frame().T
-        return result
+            keys = ', '.join(_quote_identifier(column) for column in group_by)
+            query += f' GROUP BY {keys} ORDER BY {keys}'
+        return pd.read_sql_query(query, self.db_connection, params=[dataset_id])
+    
+    def _configure_sqlite_connection(self):
+        """Tune the in-memory SQLite connection for bulk loads and reads."""
+        # The database lives in memory, so journaling and fsyncs buy nothing
+        self.db_connection.execute("PRAGMA journal_mode=OFF")
+        self.db_connection.execute("PRAGMA synchronous=OFF")
+        self.db_connection.execute("PRAGMA temp_store=MEMORY")
+        self.db_connection.execute("PRAGMA cache_size=-262144")  # 256 MB page cache
     
     def _create_tables(self):
         """Create SQLite tables if using SQLite storage."""
@@ -1,7 +1,27 @@
 import pandas as pd
 import openpyxl
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Any
 import os
+import hashlib
+import pickle
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Bytes read per step when hashing a workbook for the on-disk cache
+_HASH_CHUNK_SIZE = 64 * 1024
+
+# Read sheets with the Rust calamine parser when it is installed (pandas >= 2.2
+# supports it as an engine); otherwise pandas falls back to openpyxl
+try:
+    import python_calamine  # noqa: F401
+    _CALAMINE_SUPPORTED = tuple(int(part) for part in pd.__version__.split('.')[:2]) >= (2, 2)
+except ImportError:
+    _CALAMINE_SUPPORTED = False
+_READ_ENGINE = 'calamine' if _CALAMINE_SUPPORTED else 'openpyxl'
+
+# Upper bound on threads reading the sheets of one workbook
+_MAX_SHEET_WORKERS = min(8, os.cpu_count() or 1)
 
 
 class ExcelProcessor:
@@ -9,16 +29,34 @@ class ExcelProcessor:
     Handles Excel file reading and processing with support for multiple worksheets.
     """
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = None, dtype_backend: Optional[str] = None):
+        """
+        Initialize the processor.
+        
+        Args:
+            cache_dir: Directory for the on-disk workbook cache, keyed by file content
+                hash (None disables it)
+            dtype_backend: pandas dtype backend for sheet data ('pyarrow' keeps strings
+                in contiguous Arrow buffers, 'numpy_nullable' uses nullable dtypes);
+                None keeps pandas' default dtypes. Requires pandas >= 2.0
+        """
         self.loaded_files = {}
         self.file_info = {}
+        self.cache_dir = cache_dir
+        self.dtype_backend = dtype_backend
+        self._read_options = {'dtype_backend': dtype_backend} if dtype_backend else {}
+        self._sheets_cache: Dict[str, Dict[str, pd.DataFrame]] = {}
     
-    def load_files(self, file_paths: List[str]) -> Dict[str, Dict]:
+    def load_files(self, file_paths: List[str], use_cache: bool = True) -> Dict[str, Dict]:
         """
         Load multiple Excel files and store their information.
         
+        With a cache directory configured, unchanged files are restored from
+        the cache without opening the workbook at all.
+        
         Args:
             file_paths: List of paths to Excel files
+            use_cache: Consult and fill the on-disk cache (ignored without cache_dir)
             
         Returns:
             Dictionary containing file information for each loaded file
@@ -27,29 +65,120 @@ class ExcelProcessor:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"File not found: {file_path}")
             
+            cache_key = self._file_cache_key(file_path) if self.cache_dir and use_cache else None
+            cached = self._read_file_cache(cache_key) if cache_key else None
+            if cached is not None:
+                file_info = self._file_metadata(file_path, cached['sheets'], cache_key)
+                file_info['sheet_dims'] = cached['sheet_dims']
+                self.loaded_files[file_path] = file_info
+                self.file_info[file_path] = file_info
+                self._sheets_cache[file_path] = cached['data']
+                continue
+            
             try:
-                # Load with openpyxl for detailed sheet info
-                workbook = openpyxl.load_workbook(file_path, read_only=True)
-                
-                # Load with pandas for data processing
-                excel_file = pd.ExcelFile(file_path)
-                
-                file_info = {
-                    'file_path': file_path,
-                    'sheets': workbook.sheetnames,
-                    'sheet_count': len(workbook.sheetnames),
-                    'excel_file': excel_file,
-                    'workbook': workbook
-                }
+                # Only metadata is kept; readers are opened per operation and closed again
+                with pd.ExcelFile(file_path, engine=_READ_ENGINE) as excel_file:
+                    sheets = list(excel_file.sheet_names)
+                file_info = self._file_metadata(file_path, sheets, cache_key)
                 
                 self.loaded_files[file_path] = file_info
                 self.file_info[file_path] = file_info
+                self._sheets_cache.pop(file_path, None)
                 
             except Exception as e:
                 raise Exception(f"Error loading file {file_path}: {str(e)}")
         
         return self.file_info
     
+    def _file_metadata(self, file_path: str, sheets: List[str], cache_key: Optional[str]) -> Dict[str, Any]:
+        """Build the stored information for a loaded file (no open file handles)."""
+        stat = os.stat(file_path)
+        return {
+            'file_path': file_path,
+            'sheets': sheets,
+            'sheet_count': len(sheets),
+            'file_size': stat.st_size,
+            'modified': stat.st_mtime,
+            'sheet_dims': {},
+            'cache_key': cache_key
+        }
+    
+    def _file_cache_key(self, file_path: str) -> str:
+        """Hash a file's contents for the on-disk cache."""
+        digest = hashlib.blake2b(digest_size=16)
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        # Cached sheets carry the dtypes they were read with
+        digest.update(str(self.dtype_backend).encode())
+        return digest.hexdigest()
+    
+    def _read_file_cache(self, cache_key: str) -> Optional[Dict[str, Any]]:
+        """Load a cached workbook entry, or None on a miss or unreadable entry."""
+        cache_path = os.path.join(self.cache_dir, f"{cache_key}.pkl")
+        if not os.path.exists(cache_path):
+            return None
+        try:
+            with open(cache_path, 'rb') as f:
+                return pickle.load(f)
+        except Exception:
+            return None
+    
+    def _write_file_cache(self, file_info: Dict, all_data: Dict[str, pd.DataFrame]):
+        """Store a fully read workbook (sheet names, dimensions and data) in the on-disk cache."""
+        cache_key = file_info.get('cache_key')
+        if not cache_key:
+            return
+        entry = {
+            'sheets': file_info['sheets'],
+            'sheet_dims': {sheet: self._get_sheet_dimensions(file_info, sheet) for sheet in file_info['sheets']},
+            'data': all_data
+        }
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            with open(os.path.join(self.cache_dir, f"{cache_key}.pkl"), 'wb') as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: Could not write cache for {file_info['file_path']}: {str(e)}")
+    
+    def _parse_sheet(self, file_path: str, sheet_name: str, nrows: Optional[int] = None,
+                     excel_file: Optional[pd.ExcelFile] = None) -> pd.DataFrame:
+        """
+        Read a sheet (or its first rows), serving already-read sheets from memory.
+        
+        Args:
+            file_path: Path to the Excel file
+            sheet_name: Sheet to read
+            nrows: Number of rows to read (None for all)
+            excel_file: Reader already opened by the caller; otherwise one is
+                opened for this read and closed again
+            
+        Returns:
+            DataFrame with the sheet data
+        """
+        cached = self._sheets_cache.get(file_path, {}).get(sheet_name)
+        if cached is not None:
+            return cached.copy() if nrows is None else cached.head(nrows).copy()
+        if excel_file is not None:
+            return excel_file.parse(sheet_name, nrows=nrows, **self._read_options)
+        with pd.ExcelFile(file_path, engine=_READ_ENGINE) as excel_file:
+            return excel_file.parse(sheet_name, nrows=nrows, **self._read_options)
+    
+    def get_sheet_names(self, file_path: str) -> List[str]:
+        """
+        Get the sheet names of a loaded file without reading any sheet data.
+        
+        Args:
+            file_path: Path to the Excel file
+            
+        Returns:
+            List of sheet names in workbook order
+        """
+        if file_path not in self.loaded_files:
+            raise ValueError(f"File {file_path} not loaded. Use load_files() first.")
+        
+        return list(self.loaded_files[file_path]['sheets'])
+    
     def get_sheet_info(self, file_path: str) -> Dict:
         """
         Get detailed information about all sheets in a file.
@@ -66,33 +195,74 @@ class ExcelProcessor:
         file_info = self.loaded_files[file_path]
         sheet_info = {}
         
-        for sheet_name in file_info['sheets']:
-            try:
-                # Get sheet dimensions and basic info
-                sheet = file_info['workbook'][sheet_name]
-                # Instead of sheet.dimensions (not available for ReadOnlyWorksheet), calculate max row/col
-                max_row = 0
-                max_col = 0
-                for row in sheet.iter_rows():
-                    max_row += 1
-                    if len(row) > max_col:
-                        max_col = len(row)
-                dimensions = f"Rows: {max_row}, Columns: {max_col}"
-                # Read a sample to get column names
-                df_sample = pd.read_excel(file_path, sheet_name=sheet_name, nrows=5)
-                sheet_info[sheet_name] = {
-                    'dimensions': dimensions,
-                    'columns': list(df_sample.columns),
-                    'column_count': len(df_sample.columns),
-                    'sample_rows': len(df_sample)
-                }
-            except Exception as e:
-                sheet_info[sheet_name] = {
-                    'error': f"Error reading sheet: {str(e)}"
-                }
+        # Open one reader for all sheets, unless everything needed is already in memory
+        needs_reader = (file_path not in self._sheets_cache
+                        or any(sheet not in file_info['sheet_dims'] for sheet in file_info['sheets']))
+        with (pd.ExcelFile(file_path, engine=_READ_ENGINE) if needs_reader else nullcontext()) as excel_file:
+            for sheet_name in file_info['sheets']:
+                try:
+                    # Get sheet dimensions and basic info
+                    max_row, max_col = self._get_sheet_dimensions(file_info, sheet_name, excel_file)
+                    dimensions = f"Rows: {max_row}, Columns: {max_col}"
+                    # Read a sample to get column names
+                    df_sample = self._parse_sheet(file_path, sheet_name, nrows=5, excel_file=excel_file)
+                    sheet_info[sheet_name] = {
+                        'dimensions': dimensions,
+                        'columns': list(df_sample.columns),
+                        'column_count': len(df_sample.columns),
+                        'sample_rows': len(df_sample)
+                    }
+                except Exception as e:
+                    sheet_info[sheet_name] = {
+                        'error': f"Error reading sheet: {str(e)}"
+                    }
         
         return sheet_info
     
+    def _get_sheet_dimensions(self, file_info: Dict, sheet_name: str,
+                              excel_file: Optional[pd.ExcelFile] = None) -> Tuple[int, int]:
+        """
+        Get a sheet's row and column counts, cached on the file info.
+        
+        Read-only worksheets report the sheet's stored <dimension> record; only
+        sheets written without one are sized by openpyxl's calculate_dimension.
+        The first lookup measures every sheet of the file in one workbook open.
+        
+        Args:
+            file_info: Loaded file information
+            sheet_name: Sheet to measure
+            excel_file: Reader already opened by the caller (its openpyxl book is
+                reused under the openpyxl engine)
+            
+        Returns:
+            Tuple of (max_row, max_col)
+        """
+        sheet_dims = file_info['sheet_dims']
+        if sheet_name not in sheet_dims:
+            if excel_file is not None and _READ_ENGINE == 'openpyxl':
+                workbook, owned = excel_file.book, False
+            else:
+                workbook, owned = openpyxl.load_workbook(file_info['file_path'], read_only=True), True
+            try:
+                for name in file_info['sheets']:
+                    if name not in sheet_dims:
+                        sheet_dims[name] = self._measure_sheet(workbook[name])
+            finally:
+                if owned:
+                    workbook.close()
+        return sheet_dims[sheet_name]
+    
+    def _measure_sheet(self, sheet) -> Tuple[int, int]:
+        """Return (max_row, max_col) of a read-only worksheet."""
+        if sheet.max_row is None or sheet.max_column is None:
+            try:
+                # Sizes the sheet from its last cells without building a row count in Python
+                sheet.calculate_dimension(force=True)
+            except UnboundLocalError:
+                # openpyxl fails this way on a sheet without any rows
+                return (0, 0)
+        return (sheet.max_row, sheet.max_column)
+    
     def extract_data(self, file_path: str, sheet_name: Optional[str] = None) -> pd.DataFrame:
         """
         Extract data from a specific sheet or all sheets.
@@ -116,7 +286,7 @@ class ExcelProcessor:
             raise ValueError(f"Sheet '{sheet_name}' not found in file {file_path}")
         
         try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name)
+            df = self._parse_sheet(file_path, sheet_name)
             return df
         except Exception as e:
             raise Exception(f"Error extracting data from sheet '{sheet_name}': {str(e)}")
@@ -142,7 +312,7 @@ class ExcelProcessor:
             sheet_name = file_info['sheets'][0]
         
         try:
-            df = pd.read_excel(file_path, sheet_name=sheet_name, nrows=rows)
+            df = self._parse_sheet(file_path, sheet_name, nrows=rows)
             return df
         except Exception as e:
             raise Exception(f"Error previewing data from sheet '{sheet_name}': {str(e)}")
@@ -151,6 +321,10 @@ class ExcelProcessor:
         """
         Extract data from all sheets in a file.
         
+        Sheets are read once per loaded file, in parallel threads for
+        multi-sheet workbooks; later calls return copies of the cached
+        DataFrames (reloading the file with load_files() refreshes them).
+        
         Args:
             file_path: Path to the Excel file
             
@@ -160,14 +334,38 @@ class ExcelProcessor:
         if file_path not in self.loaded_files:
             raise ValueError(f"File {file_path} not loaded. Use load_files() first.")
         
+        if file_path in self._sheets_cache:
+            return {name: df.copy() for name, df in self._sheets_cache[file_path].items()}
+        
         file_info = self.loaded_files[file_path]
+        sheets = file_info['sheets']
         all_data = {}
         
-        for sheet_name in file_info['sheets']:
-            try:
-                df = pd.read_excel(file_path, sheet_name=sheet_name)
-                all_data[sheet_name] = df
-            except Exception as e:
-                print(f"Warning: Could not read sheet '{sheet_name}': {str(e)}")
+        if len(sheets) > 1 and _MAX_SHEET_WORKERS > 1:
+            # openpyxl handles are not thread-safe, so each worker opens its own reader
+            def read_sheet(sheet_name):
+                try:
+                    return pd.read_excel(file_path, sheet_name=sheet_name, engine=_READ_ENGINE,
+                                         **self._read_options)
+                except Exception as e:
+                    return e
+            
+            with ThreadPoolExecutor(max_workers=min(_MAX_SHEET_WORKERS, len(sheets))) as executor:
+                results = list(executor.map(read_sheet, sheets))
+        else:
+            results = []
+            for sheet_name in sheets:
+                try:
+                    results.append(self._parse_sheet(file_path, sheet_name))
+                except Exception as e:
+                    results.append(e)
+        
+        for sheet_name, result in zip(sheets, results):
+            if isinstance(result, Exception):
+                print(f"Warning: Could not read sheet '{sheet_name}': {str(result)}")
+            else:
+                all_data[sheet_name] = result
         
-        return all_data
+        self._sheets_cache[file_path] = all_data
+        self._write_file_cache(file_info, all_data)
+        return {name: df.copy() for name, df in all_data.items()}
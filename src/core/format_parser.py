@@ -1,11 +1,164 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Any, Optional, Union
+from typing import Dict, Tuple, Any, Optional
 import re
-from datetime import datetime, date
+import sys
+from functools import lru_cache
+from datetime import datetime, date, timedelta
 import dateutil.parser
-from decimal import Decimal, InvalidOperation
-import locale
+from decimal import Decimal
+
+
+# Patterns are compiled once at import time and shared by every parser instance
+_CURRENCY_SYMBOL_RE = re.compile(r'[\$€₹£¥]')
+_CURRENCY_DELETION = str.maketrans('', '', '$€₹£¥')
+_EUROPEAN_AMOUNT_RE = re.compile(r'[\d,]+\.\d{3}')
+# Separators are matched with lookarounds so one pass removes every group (1,234,567)
+_EUROPEAN_THOUSANDS_RE = re.compile(r'(?<=\d)\.(?=\d{3})')
+_THOUSANDS_SEPARATOR_RE = re.compile(r'(?<=\d),(?=\d{3})')
+
+_DATE_PATTERNS = {
+    # Day/month order of slash dates is resolved from the values in _parse_date_pattern
+    'MM/DD/YYYY': re.compile(r'(\d{1,2})/(\d{1,2})/(\d{4})', re.IGNORECASE),
+    'YYYY-MM-DD': re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})', re.IGNORECASE),
+    'DD-MON-YYYY': re.compile(r'(\d{1,2})-(\w{3})-(\d{4})', re.IGNORECASE),
+    'Quarter': re.compile(r'Q([1-4])\s+(\d{4})', re.IGNORECASE),
+    'Month-Year': re.compile(r'(\w+)\s+(\d{4})', re.IGNORECASE)
+}
+
+
+def _build_date_scanner(patterns: Dict[str, 're.Pattern']) -> Tuple['re.Pattern', Dict[str, Tuple[str, int, int]]]:
+    """
+    Fuse named date patterns into a single alternation so one scan finds the format.
+    
+    Args:
+        patterns: Ordered mapping of format names to compiled patterns
+        
+    Returns:
+        Tuple of the fused pattern and a mapping from branch group name to
+        (format name, start, end), the slice of match.groups() holding that branch's captures
+    """
+    branches = []
+    branch_groups = {}
+    group_index = 1
+    for i, (name, pattern) in enumerate(patterns.items()):
+        branch = f'_p{i}'
+        branches.append(f'(?P<{branch}>{pattern.pattern})')
+        branch_groups[branch] = (name, group_index, group_index + pattern.groups)
+        group_index += 1 + pattern.groups
+    return re.compile('|'.join(branches), re.IGNORECASE), branch_groups
+
+
+def _excel_serials_to_datetimes(serials: np.ndarray) -> Tuple[np.ndarray, pd.DatetimeIndex]:
+    """
+    Convert an array of Excel serial dates to timestamps in one vectorized pass.
+    
+    Args:
+        serials: Float array of Excel serial dates
+        
+    Returns:
+        Tuple of the leap-year adjusted serials and the converted timestamps
+    """
+    # Excel incorrectly treats 1900 as a leap year, so shift dates after 1900-02-28
+    adjusted = np.where(serials > 59, serials - 1, serials)
+    return adjusted, pd.Timestamp(1900, 1, 1) + pd.to_timedelta(adjusted - 1, unit='D')
+
+
+_DATE_SCANNER_RE, _DATE_SCANNER_BRANCHES = _build_date_scanner(_DATE_PATTERNS)
+_QUARTER_RE = re.compile(r'Q([1-4])\s+(\d{4})', re.IGNORECASE)
+_QUARTER_SHORT_RE = re.compile(r'Q([1-4])-(\d{2})', re.IGNORECASE)
+_MONTH_YEAR_RE = re.compile(r'\w+\s+\d{4}', re.IGNORECASE)
+# Explicit cases: IGNORECASE would also match the Kelvin sign, which has no multiplier
+_ABBREVIATION_SUFFIX_RE = re.compile(r'([KMBTkmbt])\Z')
+_DIGIT_RE = re.compile(r'\d')
+
+# Shortest string that can carry a date (e.g. "2024"); anything shorter is rejected up front
+_MIN_DATE_LENGTH = 4
+
+# Month lookups, built once instead of on every conversion
+_MONTH_ABBREV_NUMBERS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
+}
+_MONTH_NAME_NUMBERS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
+}
+
+# Ordinal of 1900-01-01, the day Excel serial date 1 refers to
+_EXCEL_BASE_ORDINAL = date(1900, 1, 1).toordinal()
+
+# Maximum number of distinct strings memoized per parser instance
+_PARSE_CACHE_SIZE = 100000
+
+# Adaptive parsers reorder the date scanner after this many pattern hits
+_ADAPTIVE_REORDER_INTERVAL = 1024
+
+# Overlapping date patterns that must stay behind the listed patterns when reordered
+_DATE_PATTERN_PRECEDENCE = {
+    'Month-Year': ('Quarter',)
+}
+
+# Unambiguous layouts parsed without dateutil: (pattern, pd.to_datetime format, year/month/day
+# group numbers). They read slash dates in the same order as dateutil, so results are identical
+_ISO_DATE_FORMAT = (re.compile(r'^(\d{4})-(\d{2})-(\d{2})$'), '%Y-%m-%d', (1, 2, 3))
+_SLASH_DATE_RE = re.compile(r'^(\d{1,2})/(\d{1,2})/(\d{4})$')
+_FIXED_DATE_FORMATS = (_ISO_DATE_FORMAT, (_SLASH_DATE_RE, '%m/%d/%Y', (3, 1, 2)))
+_FIXED_DATE_FORMATS_DAYFIRST = (_ISO_DATE_FORMAT, (_SLASH_DATE_RE, '%d/%m/%Y', (3, 2, 1)))
+
+# Layouts FormatParser.parse_amount_series parses in bulk, each read exactly as
+# parse_amount reads it: a signed amount with an optional currency symbol, a
+# parenthesized or trailing-minus negative, or an abbreviated amount (ASCII digits
+# only). Any other text is handed to parse_amount itself
+_AMOUNT_SERIES_RE = re.compile(
+    r'^(?:(?P<sign>-)?(?P<sym>[\$€₹£¥])?(?P<num>\d[\d.,]*)'
+    r'|\((?P<paren>\d[\d.,]*)\)'
+    r'|(?P<trail>\d[\d.,]*)-'
+    r'|(?P<abbr_num>\d[\d.]*)(?P<abbr>[KMBTkmbt]))$',
+    re.ASCII
+)
+
+
+# Largest magnitude a scaled amount may have and still fit in int64
+_MAX_SCALED_AMOUNT = 2.0 ** 63
+
+
+def to_decimal(scaled_values: pd.Series, scale: int = 100) -> pd.Series:
+    """
+    Convert fixed-point integer amounts (as returned in scaled_value) to exact Decimals.
+    
+    Args:
+        scaled_values: Integer amounts in units of 1/scale
+        scale: Scale factor the amounts were stored with
+        
+    Returns:
+        Object Series of Decimal values (None where the amount is missing)
+    """
+    divisor = Decimal(scale)
+    return pd.Series([None if pd.isna(value) else Decimal(int(value)) / divisor for value in scaled_values],
+                     index=scaled_values.index, dtype=object)
+
+
+def _float_or_nan(text: Any) -> float:
+    """float() as parse_amount applies it, with NaN where the text does not convert."""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _compact_label_columns(frame: pd.DataFrame, columns: Tuple[str, ...]) -> pd.DataFrame:
+    """
+    Store low-cardinality label columns as categoricals (one small code per row).
+    
+    Args:
+        frame: Parsed result columns
+        columns: Names of the label columns to convert
+        
+    Returns:
+        The frame with those columns as category dtype; missing labels become NaN
+    """
+    return frame.astype({column: 'category' for column in columns})
 
 
 class FormatParser:
@@ -13,7 +166,14 @@ class FormatParser:
     Handles parsing of complex financial data formats including amounts and dates.
     """
     
-    def __init__(self):
+    def __init__(self, adaptive: bool = False, dayfirst: bool = False):
+        """
+        Initialize the parser.
+        
+        Args:
+            adaptive: Reorder the date pattern scanner by observed hit frequency
+            dayfirst: Read ambiguous slash dates such as 01/02/2024 as DD/MM/YYYY
+        """
         self.currency_symbols = {
             '$': 'USD',
             '€': 'EUR', 
@@ -29,15 +189,20 @@ class FormatParser:
             'T': 1000000000000
         }
         
-        # Date format patterns
-        self.date_patterns = {
-            'MM/DD/YYYY': r'(\d{1,2})/(\d{1,2})/(\d{4})',
-            'DD/MM/YYYY': r'(\d{1,2})/(\d{1,2})/(\d{4})',
-            'YYYY-MM-DD': r'(\d{4})-(\d{1,2})-(\d{1,2})',
-            'DD-MON-YYYY': r'(\d{1,2})-(\w{3})-(\d{4})',
-            'Quarter': r'Q([1-4])\s+(\d{4})',
-            'Month-Year': r'(\w+)\s+(\d{4})'
-        }
+        # Date format patterns (precompiled)
+        self.date_patterns = dict(_DATE_PATTERNS)
+        self.dayfirst = dayfirst
+        self._dateutil_default = datetime(datetime.now().year, 1, 1)
+        self._fixed_date_formats = _FIXED_DATE_FORMATS_DAYFIRST if dayfirst else _FIXED_DATE_FORMATS
+        
+        # Fused date scanner; adaptive parsers rebuild it with the most frequent patterns first
+        self.adaptive = adaptive
+        self._date_scanner = (_DATE_SCANNER_RE, _DATE_SCANNER_BRANCHES)
+        self._date_pattern_hits = dict.fromkeys(self.date_patterns, 0)
+        
+        # Per-instance memoization of string parsing; results are copied on return
+        self._parse_amount_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(self._parse_amount_str)
+        self._parse_date_cached = lru_cache(maxsize=_PARSE_CACHE_SIZE)(self._parse_date_str)
     
     def parse_amount(self, value: Any, detected_format: Optional[Dict] = None) -> Dict[str, Any]:
         """
@@ -53,8 +218,10 @@ class FormatParser:
         if pd.isna(value) or value == '':
             return {'parsed_value': None, 'currency': None, 'is_negative': False, 'error': 'Empty value'}
         
-        str_value = str(value).strip()
-        
+        return dict(self._parse_amount_cached(str(value).strip()))
+    
+    def _parse_amount_str(self, str_value: str) -> Dict[str, Any]:
+        """Parse a stripped, non-empty amount string."""
         try:
             # Handle special formats
             if self._is_special_format(str_value):
@@ -76,7 +243,121 @@ class FormatParser:
                 'error': f'Parse error: {str(e)}',
                 'original_value': str_value
             }
-    
+
+    def parse_amount_series(self, series: pd.Series, compact: bool = False,
+                            scale: Optional[int] = None) -> pd.DataFrame:
+        """
+        Parse a whole column of amount values with vectorized string operations.
+
+        The column's format is predetected from its dtype: numeric columns
+        need no text handling and take a direct path. For text columns each
+        distinct string is parsed once and the results are broadcast back, so
+        repetitive financial columns cost O(unique values). Every row gets the
+        parsed_value, currency, is_negative and abbreviation parse_amount gives
+        for that value; error is set wherever parsed_value is missing.
+
+        Args:
+            series: Pandas Series containing raw amount values
+            compact: Return currency, abbreviation and error as categoricals
+                instead of one Python string per row
+            scale: Also return scaled_value, parsed_value as exact int64
+                fixed-point units (e.g. 100 for cents); None skips it
+
+        Returns:
+            DataFrame aligned with the input index, with parsed_value, currency,
+            is_negative, abbreviation and error columns
+        """
+        if pd.api.types.is_numeric_dtype(series) and not pd.api.types.is_bool_dtype(series):
+            return self._finish_amounts(self._parse_numeric_amounts(series), compact, scale)
+        
+        codes, uniques = pd.factorize(series.astype('string').str.strip())
+        # Missing values get code -1; route them to a trailing NA entry
+        distinct = pd.Series(uniques, dtype='string').reindex(range(len(uniques) + 1))
+        parsed = self._finish_amounts(self._parse_amount_strings(distinct), compact, scale)
+        return parsed.take(np.where(codes < 0, len(uniques), codes)).set_axis(series.index)
+
+    def _finish_amounts(self, parsed: pd.DataFrame, compact: bool, scale: Optional[int]) -> pd.DataFrame:
+        """Apply the optional compact and fixed-point outputs to parsed amounts."""
+        if compact:
+            parsed = _compact_label_columns(parsed, ('currency', 'abbreviation', 'error'))
+        if scale is not None:
+            # Amounts too large for int64 become missing
+            scaled = (parsed['parsed_value'] * scale).round()
+            parsed['scaled_value'] = scaled.where(scaled.abs() < _MAX_SCALED_AMOUNT).astype('Int64')
+        return parsed
+
+    def _parse_numeric_amounts(self, series: pd.Series) -> pd.DataFrame:
+        """
+        Amount results for an already numeric column: magnitudes and signs, no text handling.
+        
+        parse_amount reads a number through float(str(value)), which is the number itself,
+        so every value, infinities included, keeps its magnitude and a sign that is set
+        only below zero (-0.0 is not negative, as in parse_amount).
+        """
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        error = np.where(np.isnan(values), 'Empty value', None)
+        return pd.DataFrame({
+            'parsed_value': np.abs(values),
+            'currency': None,
+            'is_negative': values < 0,
+            'abbreviation': None,
+            'error': pd.Series(error, index=series.index, dtype=object)
+        }, index=series.index).astype({'currency': object, 'abbreviation': object})
+
+    def _parse_amount_strings(self, str_values: pd.Series) -> pd.DataFrame:
+        """Vectorized amount parsing of a stripped string Series (agrees with parse_amount)."""
+        parts = str_values.str.extract(_AMOUNT_SERIES_RE)
+
+        # Separators are normalized the way normalize_currency does it; abbreviated
+        # amounts are read without normalization, as handle_special_formats reads them
+        amount_part = parts['num'].fillna(parts['paren']).fillna(parts['trail'])
+        is_european = amount_part.str.contains(_EUROPEAN_AMOUNT_RE, na=False)
+        european_part = amount_part.str.replace(_EUROPEAN_THOUSANDS_RE, '', regex=True).str.replace(',', '.', regex=False)
+        standard_part = amount_part.str.replace(_THOUSANDS_SEPARATOR_RE, '', regex=True)
+        amount_part = standard_part.where(~is_european, european_part)
+
+        # float() itself rather than to_numeric, whose parsing is inexact beyond 15 digits
+        magnitude = amount_part.astype(object).map(_float_or_nan).astype(float)
+        abbreviation = parts['abbr'].str.upper().astype(object)
+        multiplier = abbreviation.map(self.abbreviation_multipliers).astype(float)
+        abbreviated_value = parts['abbr_num'].astype(object).map(_float_or_nan).astype(float) * multiplier
+        parsed_value = magnitude.fillna(abbreviated_value)
+        is_parsed = parsed_value.notna()
+
+        # '-0' is not negative (parse_amount tests the value), '(0)' and '0-' are
+        is_negative = (((parts['sign'].notna() & (magnitude > 0)) | parts['paren'].notna()
+                        | parts['trail'].notna()) & is_parsed)
+        currency = parts['sym'].astype(object).map(self.currency_symbols).where(is_parsed)
+        abbreviation = abbreviation.where(is_parsed)
+
+        # Text outside the bulk layouts ('1e5', '$-100', '(1.5K)', ...) is parsed one
+        # distinct value at a time by parse_amount, so both paths always agree
+        is_empty = str_values.isna() | str_values.eq('').fillna(True)
+        unmatched = ~is_empty & parts.isna().all(axis=1)
+        if unmatched.any():
+            fallback = pd.DataFrame([self.parse_amount(value) for value in str_values[unmatched]],
+                                    index=str_values.index[unmatched])
+            parsed_value[unmatched] = fallback['parsed_value'].astype(float)
+            is_negative[unmatched] = fallback['is_negative'].astype(bool)
+            currency[unmatched] = fallback['currency']
+            if 'abbreviation' in fallback:
+                abbreviation[unmatched] = fallback['abbreviation']
+
+        error = np.select(
+            [is_empty.to_numpy(dtype=bool), parsed_value.isna().to_numpy()],
+            ['Empty value', 'Unrecognized amount format'],
+            default=None
+        )
+
+        # Object columns keep None (not NaN) for missing values, like parse_amount
+        return pd.DataFrame({
+            'parsed_value': parsed_value,
+            'currency': currency.astype(object).where(currency.notna(), None),
+            'is_negative': is_negative.astype(bool),
+            'abbreviation': abbreviation.astype(object).where(abbreviation.notna(), None),
+            'error': pd.Series(error, index=str_values.index, dtype=object)
+        }, index=str_values.index)
+
     def parse_date(self, value: Any, detected_format: Optional[Dict] = None) -> Dict[str, Any]:
         """
         Parse date values with various formats.
@@ -91,16 +372,47 @@ class FormatParser:
         if pd.isna(value) or value == '':
             return {'parsed_value': None, 'format': None, 'error': 'Empty value'}
         
-        str_value = str(value).strip()
-        
+        return dict(self._parse_date_cached(str(value).strip()))
+    
+    def _parse_date_str(self, str_value: str) -> Dict[str, Any]:
+        """Parse a stripped, non-empty date string."""
         try:
             # Check for Excel serial date
             if self._is_excel_serial_date(str_value):
                 return self._parse_excel_serial_date(str_value)
             
-            # Try parsing with dateutil first
+            # Fixed layouts are built directly; dateutil is only needed for the rest
+            for layout_re, _, (year_group, month_group, day_group) in self._fixed_date_formats:
+                layout_match = layout_re.match(str_value)
+                if layout_match:
+                    try:
+                        parsed_date = datetime(int(layout_match.group(year_group)),
+                                               int(layout_match.group(month_group)),
+                                               int(layout_match.group(day_group)))
+                    except ValueError:
+                        break  # e.g. 31/12/2023, which dateutil reads the other way round
+                    return {
+                        'parsed_value': parsed_date,
+                        'format': 'dateutil_parsed',
+                        'year': parsed_date.year,
+                        'month': parsed_date.month,
+                        'day': parsed_date.day
+                    }
+            
+            # Every format needs a day or year digit; reject the rest before any parsing
+            if len(str_value) < _MIN_DATE_LENGTH or not _DIGIT_RE.search(str_value):
+                return {
+                    'parsed_value': None,
+                    'format': None,
+                    'error': f'Unrecognized date format: {str_value}',
+                    'original_value': str_value
+                }
+            
+            # Try parsing with dateutil next; missing fields come from a fixed default
+            # (day 1 of the current year) rather than today's date
             try:
-                parsed_date = dateutil.parser.parse(str_value)
+                parsed_date = dateutil.parser.parse(str_value, default=self._dateutil_default,
+                                                    dayfirst=self.dayfirst)
                 return {
                     'parsed_value': parsed_date,
                     'format': 'dateutil_parsed',
@@ -111,18 +423,21 @@ class FormatParser:
             except:
                 pass
             
-            # Try specific date patterns
-            for pattern_name, pattern in self.date_patterns.items():
-                match = re.match(pattern, str_value, re.IGNORECASE)
-                if match:
-                    return self._parse_date_pattern(pattern_name, match, str_value)
+            # Try specific date patterns in a single scan of the fused alternation
+            scanner_re, scanner_branches = self._date_scanner
+            match = scanner_re.match(str_value)
+            if match:
+                pattern_name, start, end = scanner_branches[match.lastgroup]
+                if self.adaptive:
+                    self._record_date_pattern_hit(pattern_name)
+                return self._parse_date_pattern(pattern_name, match.groups()[start:end], str_value)
             
             # Try quarter format
             if 'Q' in str_value.upper():
                 return self._parse_quarter_format(str_value)
             
             # Try month-year format
-            if re.match(r'\w+\s+\d{4}', str_value, re.IGNORECASE):
+            if _MONTH_YEAR_RE.match(str_value):
                 return self._parse_month_year_format(str_value)
             
             return {
@@ -140,6 +455,118 @@ class FormatParser:
                 'original_value': str_value
             }
     
+    def _record_date_pattern_hit(self, pattern_name: str) -> None:
+        """
+        Count a date pattern hit and periodically reorder the fused scanner.
+        
+        Args:
+            pattern_name: Name of the pattern that matched
+        """
+        self._date_pattern_hits[pattern_name] += 1
+        if sum(self._date_pattern_hits.values()) % _ADAPTIVE_REORDER_INTERVAL:
+            return
+        
+        # Most frequent first, but overlapping patterns never jump ahead of their precedents
+        remaining = list(self.date_patterns)
+        ordered = []
+        while remaining:
+            ready = [name for name in remaining
+                     if all(dep in ordered for dep in _DATE_PATTERN_PRECEDENCE.get(name, ()))]
+            best = max(ready, key=lambda name: self._date_pattern_hits[name])
+            ordered.append(best)
+            remaining.remove(best)
+        
+        self._date_scanner = _build_date_scanner({name: self.date_patterns[name] for name in ordered})
+    
+    def parse_date_series(self, series: pd.Series, compact: bool = False) -> pd.DataFrame:
+        """
+        Parse a whole column of date values.
+        
+        Excel serial dates and values in a fixed layout (YYYY-MM-DD, MM/DD/YYYY)
+        are converted in one vectorized pass per format; all other values go
+        through the memoized parse_date.
+        
+        Args:
+            series: Pandas Series containing raw date values
+            compact: Return format and error as categoricals instead of one
+                Python string per row
+            
+        Returns:
+            DataFrame aligned with the input index, with parsed_value, format,
+            year, month, day and error columns
+        """
+        columns = ['parsed_value', 'format', 'year', 'month', 'day', 'error']
+        positions = np.arange(len(series))
+        str_values = series.astype('string').str.strip()
+        numeric = pd.to_numeric(str_values.astype(object), errors='coerce').astype(float)
+        is_serial = numeric.between(1, 100000).to_numpy()  # Same range as _is_excel_serial_date
+        
+        # Group fixed-layout strings by format; invalid dates (e.g. 31/12/2023) fall through
+        remaining = ~is_serial
+        fixed_results = []
+        for layout_re, fmt, _ in self._fixed_date_formats:
+            in_layout = remaining & str_values.str.match(layout_re).fillna(False).to_numpy(dtype=bool)
+            if not in_layout.any():
+                continue
+            timestamps = pd.to_datetime(str_values[in_layout].astype(object), format=fmt, errors='coerce')
+            converted = timestamps.notna().to_numpy()
+            timestamps = pd.DatetimeIndex(timestamps[converted])
+            fixed_results.append(pd.DataFrame({
+                'parsed_value': pd.Series(list(timestamps), dtype=object),
+                'format': 'dateutil_parsed',
+                'year': timestamps.year,
+                'month': timestamps.month,
+                'day': timestamps.day,
+                'error': None
+            }, columns=columns).set_axis(positions[in_layout][converted]))
+            remaining[positions[in_layout][converted]] = False
+        
+        other_result = pd.DataFrame(
+            [self.parse_date(value) for value in str_values[remaining].astype(object)],
+            index=positions[remaining],
+            columns=columns
+        )
+        
+        _, timestamps = _excel_serials_to_datetimes(numeric[is_serial].to_numpy())
+        serial_result = pd.DataFrame({
+            'parsed_value': pd.Series(list(timestamps), dtype=object),
+            'format': 'excel_serial',
+            'year': timestamps.year,
+            'month': timestamps.month,
+            'day': timestamps.day,
+            'error': None
+        }, columns=columns).set_axis(positions[is_serial])
+        
+        parts = [part for part in (other_result, serial_result, *fixed_results) if not part.empty]
+        if not parts:
+            return pd.DataFrame(columns=columns, index=series.index)
+        result = pd.concat(parts).sort_index().set_axis(series.index)
+        
+        # Object columns keep None (not NaN/NaT) for missing values, like parse_date
+        for column in ('parsed_value', 'format', 'error'):
+            values = result[column].astype(object)
+            result[column] = values.where(values.notna(), None)
+        if compact:
+            result = _compact_label_columns(result, ('format', 'error'))
+        return result
+    
+    def parse_excel_serial_series(self, series: pd.Series) -> pd.Series:
+        """
+        Convert a column of Excel serial dates to a datetime64 column in one vectorized pass.
+        
+        Args:
+            series: Pandas Series of serial numbers (numeric or numeric strings)
+            
+        Returns:
+            datetime64 Series aligned with the input index; values outside the
+            Excel serial range (1-100000) or not numeric become NaT
+        """
+        serials = pd.to_numeric(series.astype(object), errors='coerce').astype(float).to_numpy()
+        # Same range as _is_excel_serial_date; out-of-range values convert as NaN
+        serials = np.where((serials >= 1) & (serials <= 100000), serials, np.nan)
+        _, timestamps = _excel_serials_to_datetimes(serials)
+        return pd.Series(timestamps, index=series.index, name=series.name)
+    
     def normalize_currency(self, value: str) -> str:
         """
         Normalize currency symbols and separators.
@@ -150,19 +577,16 @@ class FormatParser:
         Returns:
             Normalized string
         """
-        # Remove currency symbols for parsing
-        normalized = value
-        
-        # Handle European format (comma as decimal separator)
-        if re.search(r'[\d,]+\.\d{3}', normalized):
+        # Handle European format (comma as decimal separator); no commas remain afterwards
+        if '.' in value and _EUROPEAN_AMOUNT_RE.search(value):
             # European format: 1.234,56 -> 1234.56
-            normalized = re.sub(r'(\d+)\.(\d{3})', r'\1\2', normalized)
-            normalized = normalized.replace(',', '.')
+            return _EUROPEAN_THOUSANDS_RE.sub('', value).replace(',', '.')
         
         # Remove thousand separators
-        normalized = re.sub(r'(\d),(\d{3})', r'\1\2', normalized)
+        if ',' in value:
+            return _THOUSANDS_SEPARATOR_RE.sub('', value)
         
-        return normalized
+        return value
     
     def handle_special_formats(self, value: str) -> Dict[str, Any]:
         """
@@ -175,24 +599,27 @@ class FormatParser:
             Dictionary with parsed information
         """
         # Check for abbreviated formats (K, M, B, T)
-        for abbrev, multiplier in self.abbreviation_multipliers.items():
-            if value.upper().endswith(abbrev):
-                try:
-                    # Extract the numeric part
-                    numeric_part = value[:-1] if len(value) > 1 else value
-                    base_value = float(numeric_part)
-                    final_value = base_value * multiplier
-                    
-                    return {
-                        'parsed_value': final_value,
-                        'currency': None,
-                        'is_negative': False,
-                        'abbreviation': abbrev,
-                        'multiplier': multiplier,
-                        'base_value': base_value
-                    }
-                except ValueError:
-                    pass
+        abbrev_match = _ABBREVIATION_SUFFIX_RE.search(value)
+        if abbrev_match:
+            # Interned so every result shares the one 'K'/'M'/'B'/'T' object, like the other labels
+            abbrev = sys.intern(abbrev_match.group(1).upper())
+            multiplier = self.abbreviation_multipliers[abbrev]
+            try:
+                # Extract the numeric part
+                numeric_part = value[:-1] if len(value) > 1 else value
+                base_value = float(numeric_part)
+                final_value = base_value * multiplier
+                
+                return {
+                    'parsed_value': final_value,
+                    'currency': None,
+                    'is_negative': False,
+                    'abbreviation': abbrev,
+                    'multiplier': multiplier,
+                    'base_value': base_value
+                }
+            except ValueError:
+                pass
         
         # Handle negative in parentheses
         if value.startswith('(') and value.endswith(')'):
@@ -232,7 +659,7 @@ class FormatParser:
     def _is_special_format(self, value: str) -> bool:
         """Check if value is in a special format."""
         # Check for abbreviated formats
-        if any(value.upper().endswith(abbrev) for abbrev in self.abbreviation_multipliers.keys()):
+        if _ABBREVIATION_SUFFIX_RE.search(value):
             return True
         
         # Check for parentheses negative
@@ -253,14 +680,11 @@ class FormatParser:
         """Parse normalized amount value."""
         try:
             # Extract currency symbol if present
-            currency = None
-            for symbol, code in self.currency_symbols.items():
-                if symbol in normalized_value:
-                    currency = code
-                    break
+            symbol_match = _CURRENCY_SYMBOL_RE.search(normalized_value)
+            currency = self.currency_symbols.get(symbol_match.group()) if symbol_match else None
             
             # Remove currency symbols for numeric parsing
-            clean_value = re.sub(r'[\$€₹£¥]', '', normalized_value)
+            clean_value = normalized_value.translate(_CURRENCY_DELETION)
             
             # Parse as float
             parsed_value = float(clean_value)
@@ -298,9 +722,12 @@ class FormatParser:
             if serial_date > 59:  # After 1900-02-28
                 serial_date -= 1
             
-            # Convert to datetime
-            base_date = datetime(1900, 1, 1)
-            parsed_date = base_date + pd.Timedelta(days=serial_date - 1)
+            # Convert to datetime via the proleptic Gregorian ordinal (integer day math)
+            days = serial_date - 1
+            whole_days = int(days)
+            parsed_date = datetime.fromordinal(_EXCEL_BASE_ORDINAL + whole_days)
+            if days != whole_days:
+                parsed_date += timedelta(days=days - whole_days)
             
             return {
                 'parsed_value': parsed_date,
@@ -317,20 +744,22 @@ class FormatParser:
                 'error': f'Invalid Excel serial date: {str(e)}'
             }
     
-    def _parse_date_pattern(self, pattern_name: str, match, original_value: str) -> Dict[str, Any]:
+    def _parse_date_pattern(self, pattern_name: str, groups: Tuple[str, ...], original_value: str) -> Dict[str, Any]:
         """Parse date using specific pattern."""
         try:
             if pattern_name == 'MM/DD/YYYY':
-                month, day, year = match.groups()
-                parsed_date = datetime(int(year), int(month), int(day))
-            elif pattern_name == 'DD/MM/YYYY':
-                day, month, year = match.groups()
-                parsed_date = datetime(int(year), int(month), int(day))
+                first, second, year = int(groups[0]), int(groups[1]), int(groups[2])
+                # A field above 12 can only be the day; otherwise follow the dayfirst setting
+                if first > 12 or (self.dayfirst and second <= 12):
+                    pattern_name = 'DD/MM/YYYY'
+                    parsed_date = datetime(year, second, first)
+                else:
+                    parsed_date = datetime(year, first, second)
             elif pattern_name == 'YYYY-MM-DD':
-                year, month, day = match.groups()
+                year, month, day = groups
                 parsed_date = datetime(int(year), int(month), int(day))
             elif pattern_name == 'DD-MON-YYYY':
-                day, month, year = match.groups()
+                day, month, year = groups
                 # Convert month abbreviation to number
                 month_num = self._month_abbrev_to_num(month)
                 parsed_date = datetime(int(year), month_num, int(day))
@@ -361,7 +790,7 @@ class FormatParser:
         """Parse quarter format (Q1 2024, Q1-24)."""
         try:
             # Handle Q1 2024 format
-            quarter_match = re.match(r'Q([1-4])\s+(\d{4})', value, re.IGNORECASE)
+            quarter_match = _QUARTER_RE.match(value)
             if quarter_match:
                 quarter, year = quarter_match.groups()
                 quarter = int(quarter)
@@ -381,7 +810,7 @@ class FormatParser:
                 }
             
             # Handle Q1-24 format
-            quarter_match = re.match(r'Q([1-4])-(\d{2})', value, re.IGNORECASE)
+            quarter_match = _QUARTER_SHORT_RE.match(value)
             if quarter_match:
                 quarter, year_short = quarter_match.groups()
                 quarter = int(quarter)
@@ -452,16 +881,8 @@ class FormatParser:
     
     def _month_abbrev_to_num(self, month_abbrev: str) -> int:
         """Convert month abbreviation to number."""
-        month_map = {
-            'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
-            'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12
-        }
-        return month_map.get(month_abbrev.lower(), 1)
+        return _MONTH_ABBREV_NUMBERS.get(month_abbrev.lower(), 1)
     
     def _month_name_to_num(self, month_name: str) -> int:
         """Convert month name to number."""
-        month_map = {
-            'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
-            'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12
-        }
-        return month_map.get(month_name.lower(), 1)
+        return _MONTH_NAME_NUMBERS.get(month_name.lower(), 1)
@@ -2,17 +2,165 @@ import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple, Any, Optional
 import re
+import copy
+import hashlib
+from collections import OrderedDict
 from datetime import datetime
 import dateutil.parser
 from decimal import Decimal, InvalidOperation
 
 
+# Fixed helper patterns, compiled once at import time
+_CURRENCY_SYMBOL_RE = re.compile(r'[\$€₹£¥]')
+_DECIMAL_SEPARATOR_RE = re.compile(r'[.,]')
+_DIGIT_GROUP_RE = re.compile(r'[\d,]+')
+_PARENTHESES_RE = re.compile(r'\(.*\)')
+_ABBREVIATION_SUFFIX_RE = re.compile(r'[KMB]$')
+_ABBREVIATED_NUMBER_RE = re.compile(r'^[\d.]+[KMB]$', re.IGNORECASE)
+_NUMBER_NOISE_RE = re.compile(r'[\$€₹£¥,()]')
+
+# An ASCII character that no number spelling uses (float() syntax including nan/inf/
+# infinity and exponents, currency/separator noise, K/M/B suffixes). Values containing
+# one cannot score as numbers or serial dates, so they skip parsing; non-ASCII
+# characters (currency symbols, Unicode digits and spaces) are left to the parsers
+_NON_NUMERIC_CHAR_RE = re.compile(r'[^0-9.,()+\-$_eEkKmMbBnNaAiIfFtTyY\s\x80-\U0010ffff]')
+
+# Fixed-width layouts ('9' = ASCII digit) that cover most real date cells. A value
+# starting with one of these matches the detector's date patterns (YYYY-MM-DD and
+# MM/DD/YYYY) without running the regex
+_DATE_FAST_SHAPES = ('9999-99-99', '99/99/9999')
+
+# Keyword families for classify_string_type, each fused into one substring alternation
+# (matched against the lowercased value, like the `word in value` checks they replace)
+_ACCOUNT_KEYWORDS_RE = re.compile('|'.join(['account', 'acc', 'ledger', 'gl']))
+_TRANSACTION_KEYWORDS_RE = re.compile('|'.join(['transaction', 'ref', 'invoice', 'payment']))
+_COMPANY_KEYWORDS_RE = re.compile('|'.join(['inc', 'corp', 'ltd', 'company', 'co']))
+
+# Columns with more non-null values than this are scored on a fixed random sample;
+# the type scores settle long before the full column is read
+_ANALYSIS_SAMPLE_SIZE = 5000
+
+# Number of analyze_column results kept, least recently used evicted first
+_ANALYSIS_CACHE_SIZE = 512
+
+
+def _content_digest(str_data: pd.Series) -> bytes:
+    """
+    Fingerprint a column's values in order (the index is ignored).
+    
+    Args:
+        str_data: Series of string values
+        
+    Returns:
+        16-byte digest of the per-value hashes
+    """
+    value_hashes = pd.util.hash_pandas_object(str_data, index=False).to_numpy()
+    return hashlib.blake2b(value_hashes.tobytes(), digest_size=16).digest()
+
+
+def _fixed_shape_mask(values: np.ndarray, shape: str) -> np.ndarray:
+    """
+    Flag strings whose leading characters follow a fixed layout, on code points.
+    
+    Args:
+        values: Object array of strings
+        shape: Layout where '9' stands for an ASCII digit and any other character
+            must appear literally
+        
+    Returns:
+        Boolean array, True where the value starts with the layout
+    """
+    width = len(shape)
+    # Truncate/pad to the layout width, then compare UTF-32 code points column by column
+    codes = values.astype(f'<U{width}').view(np.uint32).reshape(len(values), width)
+    mask = np.ones(len(values), dtype=bool)
+    for position, char in enumerate(shape):
+        column = codes[:, position]
+        if char == '9':
+            mask &= (column >= ord('0')) & (column <= ord('9'))
+        else:
+            mask &= column == ord(char)
+    return mask
+
+
+def _fast_date_mask(values: np.ndarray) -> np.ndarray:
+    """
+    Flag strings that start with one of the _DATE_FAST_SHAPES layouts.
+    
+    Each hit is guaranteed to match the detector's date patterns, so callers only
+    need the regex for the values left over.
+    
+    Args:
+        values: Object array of stripped strings
+        
+    Returns:
+        Boolean array aligned with values
+    """
+    matched = np.zeros(len(values), dtype=bool)
+    
+    # Only digit-led values can fit a layout; text columns drop out after one cheap check
+    candidates = np.flatnonzero(_fixed_shape_mask(values, '9'))
+    if len(candidates):
+        for shape in _DATE_FAST_SHAPES:
+            matched[candidates] |= _fixed_shape_mask(values[candidates], shape)
+    return matched
+
+
+def _distinct_values(str_data: pd.Series) -> Tuple[pd.Series, np.ndarray]:
+    """
+    Reduce a column to its distinct stripped strings so each is classified once.
+    
+    Args:
+        str_data: Series of values (converted with str())
+        
+    Returns:
+        Tuple of the distinct strings and how often each occurs
+    """
+    codes, uniques = pd.factorize(str_data.astype(str).str.strip())
+    return pd.Series(uniques, dtype=object), np.bincount(codes, minlength=len(uniques))
+
+
+def _parse_float(value: str) -> float:
+    """float(value), or NaN when it does not parse; nan spellings map to +inf to stay non-null."""
+    try:
+        number = float(value)
+    except ValueError:
+        return np.nan
+    return np.inf if number != number else number
+
+
+def _to_float(str_values: pd.Series) -> pd.Series:
+    """
+    float() over strings: NaN where a value does not parse.
+    
+    pd.to_numeric is not used: it accepts strings float() rejects (e.g. '5e 0') and
+    rounds long mantissas differently, while a float() map over the distinct values
+    is as fast for the numbers that reach it.
+    
+    Args:
+        str_values: Series of stripped strings
+        
+    Returns:
+        Float Series aligned with the input; values float() accepts as nan become +inf
+    """
+    return pd.Series([_parse_float(value) for value in str_values], index=str_values.index, dtype=float)
+
+
 class DataTypeDetector:
     """
     Intelligently detects and classifies data types in columns.
     """
     
-    def __init__(self):
+    def __init__(self, sample_size: Optional[int] = _ANALYSIS_SAMPLE_SIZE):
+        """
+        Initialize the detector.
+        
+        Args:
+            sample_size: Maximum number of non-null values analyze_column scores per column
+                (a seeded random sample); None analyzes every value
+        """
+        self.sample_size = sample_size
+        self._analysis_cache: 'OrderedDict[tuple, Dict[str, Any]]' = OrderedDict()
         self.date_patterns = [
             r'\d{1,2}/\d{1,2}/\d{2,4}',  # MM/DD/YYYY, DD/MM/YYYY
             r'\d{4}-\d{1,2}-\d{1,2}',    # YYYY-MM-DD
@@ -31,6 +179,13 @@ class DataTypeDetector:
             r'^[\d,]+\.?\d*-$',          # 1234.56-
             r'^[\d.]+[KMB]$',            # 1.23K, 2.5M, 1.2B
         ]
+        
+        # All date patterns fused into one alternation, so each value takes a single match
+        # call; the named branch that matched (_d<index>) identifies the pattern
+        self._date_union = re.compile(
+            '|'.join(f'(?P<_d{i}>{pattern})' for i, pattern in enumerate(self.date_patterns)),
+            re.IGNORECASE
+        )
     
     def analyze_column(self, data: pd.Series) -> Dict[str, Any]:
         """
@@ -52,9 +207,21 @@ class DataTypeDetector:
                 'scores': {'string': 0.0, 'number': 0.0, 'date': 0.0}
             }
         
+        # Score large columns on a reproducible random sample
+        sampled = self.sample_size is not None and len(clean_data) > self.sample_size
+        if sampled:
+            clean_data = clean_data.sample(n=self.sample_size, random_state=0)
+        
         # Convert to string for pattern matching
         str_data = clean_data.astype(str)
         
+        # Identical columns (same values in the same order) reuse the earlier result
+        cache_key = (sampled, len(str_data), _content_digest(str_data))
+        cached = self._analysis_cache.get(cache_key)
+        if cached is not None:
+            self._analysis_cache.move_to_end(cache_key)
+            return copy.deepcopy(cached)
+        
         # Try parsing as dates first
         date_score = self._detect_date_format(str_data)
         
@@ -92,12 +259,20 @@ class DataTypeDetector:
         best_type = max(scores, key=scores.get)
         confidence = scores[best_type]
         
-        return {
+        result = {
             'type': best_type,
             'confidence': confidence,
             'scores': scores,
-            'format_info': self._get_format_info(str_data, best_type)
+            'format_info': self._get_format_info(str_data, best_type),
+            'sampled': sampled,
+            'sample_size': len(str_data)
         }
+        
+        self._analysis_cache[cache_key] = result
+        if len(self._analysis_cache) > _ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        # Callers get their own copy; the scores and format lists are nested too
+        return copy.deepcopy(result)
     
     def detect_date_format(self, sample_values: pd.Series) -> Dict[str, Any]:
         """
@@ -121,11 +296,10 @@ class DataTypeDetector:
             except ValueError:
                 pass
             
-            # Check for various date patterns
-            for pattern in self.date_patterns:
-                if re.match(pattern, str(value), re.IGNORECASE):
-                    date_formats.append(pattern)
-                    break
+            # Check for various date patterns (first listed pattern wins)
+            match = self._date_union.match(str(value))
+            if match:
+                date_formats.append(self.date_patterns[int(match.lastgroup[2:])])
         
         return {
             'detected_patterns': list(set(date_formats)),
@@ -149,32 +323,40 @@ class DataTypeDetector:
         thousand_separators = []
         negative_formats = []
         
+        abbreviated = False
+        
         for value in sample_values:
+            value_str = str(value)
+            
             # Check for currency symbols
-            if re.search(r'[\$€₹£¥]', str(value)):
-                currency_symbols.append(re.search(r'[\$€₹£¥]', str(value)).group())
+            currency_match = _CURRENCY_SYMBOL_RE.search(value_str)
+            if currency_match:
+                currency_symbols.append(currency_match.group())
             
             # Check for decimal separators
-            if re.search(r'[.,]', str(value)):
-                decimal_sep = re.search(r'[.,]', str(value)).group()
-                decimal_separators.append(decimal_sep)
+            decimal_match = _DECIMAL_SEPARATOR_RE.search(value_str)
+            if decimal_match:
+                decimal_separators.append(decimal_match.group())
             
             # Check for thousand separators
-            if re.search(r'[\d,]+', str(value)):
-                thousand_sep = re.search(r'[\d,]+', str(value)).group()
-                if ',' in thousand_sep:
-                    thousand_separators.append(',')
+            group_match = _DIGIT_GROUP_RE.search(value_str)
+            if group_match and ',' in group_match.group():
+                thousand_separators.append(',')
             
             # Check for negative formats
-            if re.search(r'\(.*\)', str(value)) or str(value).endswith('-'):
-                negative_formats.append(str(value))
+            if _PARENTHESES_RE.search(value_str) or value_str.endswith('-'):
+                negative_formats.append(value_str)
+            
+            # Check for abbreviated formats (K, M, B)
+            if not abbreviated and _ABBREVIATION_SUFFIX_RE.search(value_str):
+                abbreviated = True
         
         return {
             'currency_symbols': list(set(currency_symbols)),
             'decimal_separators': list(set(decimal_separators)),
             'thousand_separators': list(set(thousand_separators)),
             'negative_formats': list(set(negative_formats)),
-            'abbreviated_formats': any(re.search(r'[KMB]$', str(v)) for v in sample_values)
+            'abbreviated_formats': abbreviated
         }
     
     def classify_string_type(self, sample_values: pd.Series) -> Dict[str, Any]:
@@ -196,15 +378,15 @@ class DataTypeDetector:
             value_str = str(value).lower()
             
             # Account-related patterns
-            if any(word in value_str for word in ['account', 'acc', 'ledger', 'gl']):
+            if _ACCOUNT_KEYWORDS_RE.search(value_str):
                 account_patterns.append(value)
             
             # Transaction-related patterns
-            if any(word in value_str for word in ['transaction', 'ref', 'invoice', 'payment']):
+            if _TRANSACTION_KEYWORDS_RE.search(value_str):
                 transaction_patterns.append(value)
             
             # Company-related patterns
-            if any(word in value_str for word in ['inc', 'corp', 'ltd', 'company', 'co']):
+            if _COMPANY_KEYWORDS_RE.search(value_str):
                 company_patterns.append(value)
         
         return {
@@ -226,32 +408,12 @@ class DataTypeDetector:
         Returns:
             Confidence score between 0 and 1
         """
-        date_count = 0
         total_count = len(str_data)
+        if total_count == 0:
+            return 0.0
         
-        for value in str_data:
-            value_str = str(value).strip()
-            
-            # Check for Excel serial dates (much more restrictive)
-            try:
-                float_val = float(value_str)
-                # Only consider as Excel date if it's an integer in a reasonable date range
-                if float_val == int(float_val):  # Must be integer
-                    # Excel dates: 1 = Jan 1, 1900, 73050 = Dec 31, 2099
-                    # But be more restrictive - only consider if it's in a reasonable range
-                    if 1000 <= float_val <= 73050:  # More reasonable range
-                        date_count += 1
-                        continue
-            except ValueError:
-                pass
-            
-            # Check for date patterns (more specific)
-            for pattern in self.date_patterns:
-                if re.match(pattern, value_str, re.IGNORECASE):
-                    date_count += 1
-                    break
-        
-        return date_count / total_count if total_count > 0 else 0.0
+        stripped, counts = _distinct_values(str_data)
+        return int(counts[self._date_mask(stripped).to_numpy()].sum()) / total_count
     
     def _detect_number_format(self, str_data: pd.Series) -> float:
         """
@@ -263,41 +425,59 @@ class DataTypeDetector:
         Returns:
             Confidence score between 0 and 1
         """
-        number_count = 0
         total_count = len(str_data)
+        if total_count == 0:
+            return 0.0
         
-        for value in str_data:
-            value_str = str(value).strip()
-            
-            # Skip if it looks like a date first
-            is_date = False
-            for pattern in self.date_patterns:
-                if re.match(pattern, value_str, re.IGNORECASE):
-                    is_date = True
-                    break
-            
-            if is_date:
-                continue  # Skip date-like values
-            
-            # Try to parse as number
-            try:
-                # Remove common currency symbols and separators
-                clean_value = re.sub(r'[\$€₹£¥,()]', '', value_str)
-                clean_value = clean_value.replace('-', '')
-                
-                # Try parsing as float
-                float(clean_value)
-                number_count += 1
-                continue
-            except ValueError:
-                pass
+        stripped, counts = _distinct_values(str_data)
+        is_number = pd.Series(False, index=stripped.index)
+        
+        # Values in a common date layout are never numbers, so they skip the parsing below
+        rest = stripped[~_fast_date_mask(stripped.to_numpy(dtype=object))]
+        
+        # Cheap character-class prefilter: most text values drop out before any parsing
+        rest = rest[~rest.str.contains(_NON_NUMERIC_CHAR_RE).to_numpy(dtype=bool)]
+        
+        # Remove common currency symbols and separators, then try parsing as float
+        clean_values = rest.str.replace(_NUMBER_NOISE_RE, '', regex=True).str.replace('-', '', regex=False)
+        parsed = _to_float(clean_values).notna().to_numpy()
+        is_number[rest.index] = parsed
+        
+        # Check for abbreviated formats (K, M, B)
+        rest = rest[~parsed]
+        is_number[rest.index] = rest.str.match(_ABBREVIATED_NUMBER_RE).to_numpy(dtype=bool)
+        
+        # Skip date-like values (only the candidates need checking)
+        candidates = stripped[is_number]
+        is_number[candidates.index] = ~candidates.str.match(self._date_union).to_numpy(dtype=bool)
+        
+        return int(counts[is_number.to_numpy()].sum()) / total_count
+    
+    def _date_mask(self, stripped: pd.Series) -> pd.Series:
+        """
+        Flag values that look like dates, in vectorized passes over the column.
+        
+        Args:
+            stripped: Series of whitespace-stripped string values
             
-            # Check for abbreviated formats (K, M, B)
-            if re.match(r'^[\d.]+[KMB]$', value_str, re.IGNORECASE):
-                number_count += 1
-                continue
+        Returns:
+            Boolean Series, True for Excel serial dates and date-pattern matches
+        """
+        # Values in a common date layout are settled without parsing or regex matching
+        is_date = pd.Series(_fast_date_mask(stripped.to_numpy(dtype=object)), index=stripped.index)
+        rest = stripped[~is_date]
+        
+        # Excel serial dates (much more restrictive): integers in a reasonable date range,
+        # 1000 to 73050 (Dec 31, 2099)
+        numeric_like = rest[~rest.str.contains(_NON_NUMERIC_CHAR_RE).to_numpy(dtype=bool)]
+        numbers = _to_float(numeric_like)
+        is_serial = ((numbers == np.floor(numbers)) & numbers.between(1000, 73050)).to_numpy()
+        is_date[numeric_like.index] = is_serial
         
-        return number_count / total_count if total_count > 0 else 0.0
+        # Check for date patterns (more specific), skipping values already counted as serials
+        rest = rest.drop(numeric_like.index[is_serial])
+        is_date[rest.index] = rest.str.match(self._date_union).to_numpy(dtype=bool)
+        return is_date
     
     def _get_format_info(self, str_data: pd.Series, detected_type: str) -> Dict[str, Any]:
         """
@@ -1,9 +1,39 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple, Union
 import os
+import stat as stat_module
 from datetime import datetime
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+
+# Upper bound on threads create_summary_report uses for per-column statistics
+_MAX_SUMMARY_WORKERS = min(8, os.cpu_count() or 1)
+
+# Serialize summaries with orjson when it is installed: numpy scalars and datetimes are
+# encoded natively in C instead of through a per-value default=str callback
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# create_summary_report statistics group per dtype.kind; same split as
+# pd.api.types.is_numeric_dtype (bool/int/uint/float/complex, nullable and sparse
+# included) and is_datetime64_any_dtype (naive and tz-aware)
+_SUMMARY_KIND_GROUPS = {
+    'b': 'numeric', 'i': 'numeric', 'u': 'numeric', 'f': 'numeric', 'c': 'numeric',
+    'M': 'datetime',
+}
+
+# validate_dataframe_structure skips its full-frame duplicate check above this many rows
+_DUPLICATE_CHECK_MAX_ROWS = 1_000_000
+
+# Units used by format_file_size, each 1024 times the previous
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB')
+
+# detect_encoding only sniffs this much of a file; encodings are evident well within it
+_ENCODING_SNIFF_BYTES = 256 * 1024
 
 
 def validate_file_path(file_path: str) -> bool:
@@ -19,6 +49,18 @@ def validate_file_path(file_path: str) -> bool:
     return os.path.exists(file_path) and os.path.isfile(file_path)
 
 
+def _file_info_from_stat(file_path: str, stat_result: os.stat_result) -> Dict[str, Any]:
+    """Build the get_file_info dictionary from an already-fetched stat result."""
+    return {
+        'file_path': file_path,
+        'file_name': os.path.basename(file_path),
+        'file_size': stat_result.st_size,
+        'file_size_mb': round(stat_result.st_size / (1024 * 1024), 2),
+        'modified_time': datetime.fromtimestamp(stat_result.st_mtime),
+        'extension': os.path.splitext(file_path)[1].lower()
+    }
+
+
 def get_file_info(file_path: str) -> Dict[str, Any]:
     """
     Get basic information about a file.
@@ -29,23 +71,47 @@ def get_file_info(file_path: str) -> Dict[str, Any]:
     Returns:
         Dictionary with file information
     """
-    if not validate_file_path(file_path):
+    # A single stat answers both "is it a regular file?" and the size/mtime questions
+    try:
+        stat_result = os.stat(file_path)
+    except OSError:
+        return {'error': f'File not found: {file_path}'}
+    if not stat_module.S_ISREG(stat_result.st_mode):
         return {'error': f'File not found: {file_path}'}
     
     try:
-        stat = os.stat(file_path)
-        return {
-            'file_path': file_path,
-            'file_name': os.path.basename(file_path),
-            'file_size': stat.st_size,
-            'file_size_mb': round(stat.st_size / (1024 * 1024), 2),
-            'modified_time': datetime.fromtimestamp(stat.st_mtime),
-            'extension': os.path.splitext(file_path)[1].lower()
-        }
+        return _file_info_from_stat(file_path, stat_result)
     except Exception as e:
         return {'error': f'Error getting file info: {str(e)}'}
 
 
+def get_files_info(dir_path: str, extensions: Optional[Tuple[str, ...]] = None) -> List[Dict[str, Any]]:
+    """
+    Get basic information about every file in a directory.
+    
+    Walks the directory once with os.scandir, whose entries already know their
+    file type, instead of checking and stat-ing each path separately.
+    
+    Args:
+        dir_path: Directory to list (not recursive)
+        extensions: Optional lowercase extensions to keep, e.g. ('.xlsx', '.xls')
+        
+    Returns:
+        List of get_file_info dictionaries, sorted by file name
+    """
+    files_info = []
+    with os.scandir(dir_path) as entries:
+        for entry in entries:
+            if not entry.is_file():
+                continue
+            if extensions is not None and os.path.splitext(entry.name)[1].lower() not in extensions:
+                continue
+            files_info.append(_file_info_from_stat(entry.path, entry.stat()))
+    
+    files_info.sort(key=lambda info: info['file_name'])
+    return files_info
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -58,12 +124,9 @@ def format_file_size(size_bytes: int) -> str:
     """
     if size_bytes < 1024:
         return f"{size_bytes} B"
-    elif size_bytes < 1024 * 1024:
-        return f"{size_bytes / 1024:.1f} KB"
-    elif size_bytes < 1024 * 1024 * 1024:
-        return f"{size_bytes / (1024 * 1024):.1f} MB"
-    else:
-        return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit directly
+    unit = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * unit)):.1f} {_SIZE_UNITS[unit]}"
 
 
 def safe_convert_to_numeric(series: pd.Series) -> pd.Series:
@@ -81,32 +144,78 @@ def safe_convert_to_numeric(series: pd.Series) -> pd.Series:
 
 def detect_encoding(file_path: str) -> str:
     """
-    Detect the encoding of a file.
+    Detect the encoding of a file from its first _ENCODING_SNIFF_BYTES bytes.
+    
+    Uses charset-normalizer when installed, otherwise chardet.
     
     Args:
         file_path: Path to the file
         
     Returns:
-        Detected encoding
+        Detected encoding ('utf-8' when neither detector is available or the
+        encoding cannot be determined)
     """
-    import chardet
-    
     try:
         with open(file_path, 'rb') as f:
-            raw_data = f.read()
-            result = chardet.detect(raw_data)
-            return result['encoding']
-    except Exception:
+            raw_data = f.read(_ENCODING_SNIFF_BYTES)
+    except OSError:
         return 'utf-8'  # Default fallback
+    
+    try:
+        from charset_normalizer import from_bytes
+    except ImportError:
+        try:
+            import chardet
+        except ImportError:
+            return 'utf-8'
+        return chardet.detect(raw_data)['encoding'] or 'utf-8'
+    
+    best = from_bytes(raw_data).best()
+    return best.encoding if best is not None else 'utf-8'
+
+
+def _column_reductions(dataframe: pd.DataFrame, columns: List[Any],
+                        reductions: Tuple[str, ...]) -> Dict[Any, Dict[str, Any]]:
+    """
+    Run DataFrame-wide reductions over columns, grouped by dtype.
+    
+    Reducing same-dtype blocks in one call per statistic avoids a Python round
+    trip per column, and keeps each column's scalar type (an int column's min
+    stays an int instead of being upcast alongside float columns).
+    
+    Args:
+        dataframe: DataFrame holding the columns
+        columns: Column labels to reduce
+        reductions: DataFrame reduction method names, e.g. ('min', 'max')
+        
+    Returns:
+        Dictionary mapping each column to {reduction name: value}
+    """
+    by_dtype: Dict[Any, List[Any]] = {}
+    for column in columns:
+        by_dtype.setdefault(dataframe[column].dtype, []).append(column)
+    
+    stats: Dict[Any, Dict[str, Any]] = {column: {} for column in columns}
+    for group in by_dtype.values():
+        block = dataframe[group]
+        for name in reductions:
+            values = getattr(block, name)()
+            for column in group:
+                stats[column][name] = values[column]
+    return stats
 
 
-def create_summary_report(dataframe: pd.DataFrame, title: str = "Data Summary") -> Dict[str, Any]:
+def create_summary_report(dataframe: pd.DataFrame, title: str = "Data Summary",
+                          deep: bool = False) -> Dict[str, Any]:
     """
     Create a comprehensive summary report for a DataFrame.
     
     Args:
         dataframe: DataFrame to analyze
         title: Title for the report
+        deep: Also hash every row to count duplicates and measure string contents
+            for memory usage. Both are full passes over the data, so by default
+            duplicate_rows is None and memory_usage_mb is the shallow (buffer) size
         
     Returns:
         Dictionary with summary information
@@ -114,56 +223,74 @@ def create_summary_report(dataframe: pd.DataFrame, title: str = "Data Summary")
     if dataframe.empty:
         return {'error': 'DataFrame is empty'}
     
+    null_counts = dataframe.isnull().sum()
+    
     summary = {
         'title': title,
         'timestamp': datetime.now().isoformat(),
         'basic_info': {
             'rows': len(dataframe),
             'columns': len(dataframe.columns),
-            'memory_usage_mb': round(dataframe.memory_usage(deep=True).sum() / (1024 * 1024), 2),
-            'duplicate_rows': dataframe.duplicated().sum(),
-            'null_values': dataframe.isnull().sum().sum()
+            'memory_usage_mb': round(dataframe.memory_usage(deep=deep).sum() / (1024 * 1024), 2),
+            'duplicate_rows': dataframe.duplicated().sum() if deep else None,
+            'null_values': null_counts.sum()
         },
         'column_info': {},
         'data_types': dataframe.dtypes.to_dict(),
         'sample_data': dataframe.head(5).to_dict('records')
     }
     
-    # Analyze each column
-    for column in dataframe.columns:
+    # Route columns by their one-character dtype kind; everything else is summarized as text
+    columns_by_group: Dict[str, List[Any]] = {'numeric': [], 'datetime': []}
+    for column, dtype in dataframe.dtypes.items():
+        group = _SUMMARY_KIND_GROUPS.get(dtype.kind)
+        if group is not None:
+            columns_by_group[group].append(column)
+    numeric_columns, datetime_columns = columns_by_group['numeric'], columns_by_group['datetime']
+    
+    # Numeric and datetime statistics are reduced for all such columns up front
+    numeric_stats = _column_reductions(dataframe, numeric_columns, ('min', 'max', 'mean', 'median', 'std'))
+    datetime_stats = _column_reductions(dataframe, datetime_columns, ('min', 'max'))
+    
+    def summarize_column(column):
         col_data = dataframe[column]
         col_info = {
             'data_type': str(col_data.dtype),
-            'null_count': col_data.isnull().sum(),
-            'null_percentage': round((col_data.isnull().sum() / len(col_data)) * 100, 2),
+            'null_count': null_counts[column],
+            'null_percentage': round((null_counts[column] / len(col_data)) * 100, 2),
             'unique_values': col_data.nunique()
         }
         
         # Add type-specific information
-        if pd.api.types.is_numeric_dtype(col_data):
+        if column in numeric_stats:
+            col_info.update(numeric_stats[column])
+        elif column in datetime_stats:
+            min_date, max_date = datetime_stats[column]['min'], datetime_stats[column]['max']
             col_info.update({
-                'min': col_data.min(),
-                'max': col_data.max(),
-                'mean': col_data.mean(),
-                'median': col_data.median(),
-                'std': col_data.std()
-            })
-        elif pd.api.types.is_datetime64_any_dtype(col_data):
-            col_info.update({
-                'min_date': col_data.min(),
-                'max_date': col_data.max(),
-                'date_range_days': (col_data.max() - col_data.min()).days
+                'min_date': min_date,
+                'max_date': max_date,
+                'date_range_days': (max_date - min_date).days
             })
         else:
-            # String/object type
+            # String/object type: measure the lengths once and reuse them
+            lengths = col_data.astype(str).str.len()
             col_info.update({
-                'min_length': col_data.astype(str).str.len().min(),
-                'max_length': col_data.astype(str).str.len().max(),
-                'avg_length': col_data.astype(str).str.len().mean(),
-                'most_common': col_data.value_counts().head(3).to_dict()
+                'min_length': lengths.min(),
+                'max_length': lengths.max(),
+                'avg_length': lengths.mean(),
+                # Partial selection of the top 3 instead of sorting every distinct value
+                'most_common': col_data.value_counts(sort=False).nlargest(3).to_dict()
             })
-        
-        summary['column_info'][column] = col_info
+        return col_info
+    
+    # Analyze each column; columns are independent, so wide frames spread them over threads
+    columns = list(dataframe.columns)
+    if len(columns) > 1 and _MAX_SUMMARY_WORKERS > 1:
+        with ThreadPoolExecutor(max_workers=min(_MAX_SUMMARY_WORKERS, len(columns))) as executor:
+            column_infos = list(executor.map(summarize_column, columns))
+    else:
+        column_infos = [summarize_column(column) for column in columns]
+    summary['column_info'] = dict(zip(columns, column_infos))
     
     return summary
 
@@ -172,6 +299,9 @@ def export_summary_to_json(summary: Dict[str, Any], output_path: str) -> bool:
     """
     Export summary report to JSON file.
     
+    With orjson installed, numpy numbers are written as JSON numbers, datetimes as
+    ISO 8601 strings and NaN as null; other values fall back to str() either way.
+    
     Args:
         summary: Summary dictionary
         output_path: Path to save the JSON file
@@ -180,6 +310,11 @@ def export_summary_to_json(summary: Dict[str, Any], output_path: str) -> bool:
         True if successful, False otherwise
     """
     try:
+        if orjson is not None:
+            options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+            with open(output_path, 'wb') as f:
+                f.write(orjson.dumps(summary, option=options, default=str))
+            return True
         with open(output_path, 'w', encoding='utf-8') as f:
             json.dump(summary, f, indent=2, default=str)
         return True
@@ -188,17 +323,21 @@ def export_summary_to_json(summary: Dict[str, Any], output_path: str) -> bool:
         return False
 
 
-def calculate_performance_metrics(func, *args, **kwargs) -> Dict[str, Any]:
+def calculate_performance_metrics(func, *args, return_value: bool = False,
+                                  **kwargs) -> Union[Dict[str, Any], Tuple[Dict[str, Any], Any]]:
     """
     Calculate performance metrics for a function execution.
     
     Args:
         func: Function to measure
         *args: Function arguments
+        return_value: If True, also return the function's result so callers
+            don't need to run the function a second time
         **kwargs: Function keyword arguments
         
     Returns:
-        Dictionary with performance metrics
+        Dictionary with performance metrics, or a (metrics, result) tuple
+        when return_value is True
     """
     import time
     import psutil
@@ -209,9 +348,9 @@ def calculate_performance_metrics(func, *args, **kwargs) -> Dict[str, Any]:
     initial_memory = process.memory_info().rss / 1024 / 1024  # MB
     
     # Measure execution time
-    start_time = time.time()
+    start_time = time.perf_counter()
     result = func(*args, **kwargs)
-    end_time = time.time()
+    end_time = time.perf_counter()
     
     # Get final memory usage
     final_memory = process.memory_info().rss / 1024 / 1024  # MB
@@ -220,7 +359,7 @@ def calculate_performance_metrics(func, *args, **kwargs) -> Dict[str, Any]:
     # Force garbage collection
     gc.collect()
     
-    return {
+    metrics = {
         'execution_time_seconds': round(end_time - start_time, 4),
         'memory_used_mb': round(memory_used, 2),
         'initial_memory_mb': round(initial_memory, 2),
@@ -228,15 +367,22 @@ def calculate_performance_metrics(func, *args, **kwargs) -> Dict[str, Any]:
         'result_type': type(result).__name__,
         'success': True
     }
+    
+    if return_value:
+        return metrics, result
+    return metrics
 
 
-def validate_dataframe_structure(df: pd.DataFrame, expected_columns: List[str] = None) -> Dict[str, Any]:
+def validate_dataframe_structure(df: pd.DataFrame, expected_columns: List[str] = None,
+                                 duplicate_check_max_rows: Optional[int] = _DUPLICATE_CHECK_MAX_ROWS) -> Dict[str, Any]:
     """
     Validate DataFrame structure and data quality.
     
     Args:
         df: DataFrame to validate
         expected_columns: List of expected column names
+        duplicate_check_max_rows: Skip the duplicate-row check (it hashes every row)
+            for frames with more rows than this; None always checks
         
     Returns:
         Dictionary with validation results
@@ -282,8 +428,13 @@ def validate_dataframe_structure(df: pd.DataFrame, expected_columns: List[str] =
         validation_result['warnings'].append(f'Columns with null values: {columns_with_nulls.to_dict()}')
     
     # Check for duplicate rows
-    duplicate_count = df.duplicated().sum()
-    if duplicate_count > 0:
-        validation_result['warnings'].append(f'Found {duplicate_count} duplicate rows')
+    if duplicate_check_max_rows is not None and len(df) > duplicate_check_max_rows:
+        validation_result['warnings'].append(
+            f'Skipped duplicate row check for {len(df)} rows (limit {duplicate_check_max_rows})'
+        )
+    else:
+        duplicate_count = df.duplicated().sum()
+        if duplicate_count > 0:
+            validation_result['warnings'].append(f'Found {duplicate_count} duplicate rows')
     
     return validation_result 
\ No newline at end of file
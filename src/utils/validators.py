@@ -1,20 +1,110 @@
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Iterator, Optional, Union
 import re
+import csv
+import zipfile
+import xml.etree.ElementTree as ET
+from functools import lru_cache
 from datetime import datetime, date
 import dateutil.parser
 
 
-def validate_amount_format(value: str) -> Dict[str, Any]:
+# Patterns are compiled once at import time; order matters (first match wins)
+_AMOUNT_PATTERNS = (
+    ('us_currency', re.compile(r'^\$[\d,]+\.?\d*$', re.IGNORECASE)),
+    ('european_currency', re.compile(r'^€[\d.,]+$', re.IGNORECASE)),
+    ('indian_currency', re.compile(r'^₹[\d,]+\.?\d*$', re.IGNORECASE)),
+    ('negative_parentheses', re.compile(r'^\([\d,]+\.?\d*\)$', re.IGNORECASE)),
+    ('trailing_negative', re.compile(r'^[\d,]+\.?\d*-$', re.IGNORECASE)),
+    ('abbreviated', re.compile(r'^[\d.]+[KMBT]$', re.IGNORECASE)),
+    ('plain_number', re.compile(r'^[\d,]+\.?\d*$', re.IGNORECASE))
+)
+
+_DATE_PATTERNS = (
+    # Slash dates whose first field cannot be a month are reported as dd_mm_yyyy
+    ('mm_dd_yyyy', re.compile(r'^\d{1,2}/\d{1,2}/\d{4}$', re.IGNORECASE)),
+    ('yyyy_mm_dd', re.compile(r'^\d{4}-\d{1,2}-\d{1,2}$', re.IGNORECASE)),
+    ('dd_mon_yyyy', re.compile(r'^\d{1,2}-\w{3}-\d{4}$', re.IGNORECASE)),
+    ('quarter', re.compile(r'^Q[1-4]\s+\d{4}$', re.IGNORECASE)),
+    ('quarter_short', re.compile(r'^Q[1-4]-\d{2}$', re.IGNORECASE)),
+    ('month_year', re.compile(r'^\w+\s+\d{4}$', re.IGNORECASE)),
+    ('excel_serial', re.compile(r'^\d{5}$', re.IGNORECASE))  # Excel serial dates are typically 5 digits
+)
+
+
+def _fuse_patterns(patterns) -> 're.Pattern':
     """
-    Validate amount format and return parsing result.
+    Combine (name, pattern) pairs into one alternation whose match.lastgroup is the name.
+    
+    Every pattern is anchored with ^...$, so the anchors are hoisted out of the
+    branches and checked once around the whole alternation.
+    """
+    branches = '|'.join(f'(?P<{name}>{pattern.pattern[1:-1]})' for name, pattern in patterns)
+    return re.compile(f'^(?:{branches})$', re.IGNORECASE)
+
+
+# One scan per value; alternation order preserves the first-match-wins priority
+_DATE_FORMAT_RE = _fuse_patterns(_DATE_PATTERNS)
+
+# The amount patterns are mutually exclusive on the first or last character, so one
+# character lookup picks the only pattern that can match and a single regex confirms it
+_AMOUNT_PATTERN_BY_NAME = dict(_AMOUNT_PATTERNS)
+_AMOUNT_PREFIX_PATTERNS = {
+    '$': 'us_currency',
+    '€': 'european_currency',
+    '₹': 'indian_currency',
+    '(': 'negative_parentheses',
+}
+# IGNORECASE lets [KMBT] match lowercase letters and the Kelvin sign as well
+_AMOUNT_ABBREVIATION_SUFFIXES = frozenset('KMBTkmbt\u212a')
+
+_DIGIT_RE = re.compile(r'\d')
+
+# Non-digit characters a float() literal can start with (sign, point, nan, inf/infinity)
+_FLOAT_LEADING_CHARS = frozenset('.+-nNiI')
+
+# Shortest string that can carry a date (e.g. "2024") once Excel serials are handled
+_MIN_DATE_LENGTH = 4
+
+# Exact layouts (no surrounding text) that always validate as yyyy_mm_dd or as a
+# slash date; '9' stands for an ASCII digit
+_DATE_SURE_SHAPES = (
+    '9999-99-99', '9999-9-99', '9999-99-9', '9999-9-9',
+    '99/99/9999', '9/99/9999', '99/9/9999', '9/9/9999',
+)
+
+# Longest distinct value the code-point prefilter lays out in its matrix; longer
+# values go straight to validate_date_format
+_DATE_PREFILTER_MAX_WIDTH = 32
+
+# Column-name keywords for validate_financial_data_quality, each family fused into one
+# substring alternation (matched against the lowercased name)
+_DATE_COLUMN_RE = re.compile('|'.join(['date', 'time', 'created', 'updated']))
+_AMOUNT_COLUMN_RE = re.compile('|'.join(['amount', 'value', 'price', 'cost', 'revenue', 'balance']))
+
+# Where .xlsx packages keep the workbook part when _rels/.rels does not say otherwise
+_DEFAULT_WORKBOOK_PART = 'xl/workbook.xml'
+
+# Data rows read when previewing a CSV file in validate_file_format
+_CSV_PREVIEW_ROWS = 5
+
+# Maximum number of distinct strings memoized by each validator
+_VALIDATION_CACHE_SIZE = 100000
+
+
+def _run_validator(validator, value: Any) -> Dict[str, Any]:
+    """
+    Shared front end of the format validators: reject empty/null values, then run
+    the memoized string validator on the stripped text.
     
     Args:
-        value: String value to validate
+        validator: Cached function taking a stripped string (_validate_amount_str or
+            _validate_date_str)
+        value: Value to validate
         
     Returns:
-        Dictionary with validation results
+        Dictionary with validation results (a copy the caller may modify)
     """
     if not value or pd.isna(value):
         return {
@@ -23,24 +113,40 @@ def validate_amount_format(value: str) -> Dict[str, Any]:
             'parsed_value': None
         }
     
-    # Common amount patterns
-    patterns = {
-        'us_currency': r'^\$[\d,]+\.?\d*$',
-        'european_currency': r'^€[\d.,]+$',
-        'indian_currency': r'^₹[\d,]+\.?\d*$',
-        'negative_parentheses': r'^\([\d,]+\.?\d*\)$',
-        'trailing_negative': r'^[\d,]+\.?\d*-$',
-        'abbreviated': r'^[\d.]+[KMBT]$',
-        'plain_number': r'^[\d,]+\.?\d*$'
-    }
-    
-    str_value = str(value).strip()
+    return dict(validator(str(value).strip()))
+
+
+def validate_amount_format(value: str) -> Dict[str, Any]:
+    """
+    Validate amount format and return parsing result.
     
-    for pattern_name, pattern in patterns.items():
-        if re.match(pattern, str_value, re.IGNORECASE):
+    Args:
+        value: String value to validate
+        
+    Returns:
+        Dictionary with validation results
+    """
+    return _run_validator(_validate_amount_str, value)
+
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_amount_str(str_value: str) -> Dict[str, Any]:
+    """Validate a stripped amount string (memoized; callers receive a copy)."""
+    if str_value:
+        pattern = _AMOUNT_PREFIX_PATTERNS.get(str_value[0])
+        if pattern is None:
+            last_char = str_value[-1]
+            if last_char == '-':
+                pattern = 'trailing_negative'
+            elif last_char in _AMOUNT_ABBREVIATION_SUFFIXES:
+                pattern = 'abbreviated'
+            else:
+                pattern = 'plain_number'
+        
+        if _AMOUNT_PATTERN_BY_NAME[pattern].match(str_value):
             return {
                 'is_valid': True,
-                'pattern': pattern_name,
+                'pattern': pattern,
                 'parsed_value': str_value
             }
     
@@ -61,47 +167,47 @@ def validate_date_format(value: str) -> Dict[str, Any]:
     Returns:
         Dictionary with validation results
     """
-    if not value or pd.isna(value):
+    return _run_validator(_validate_date_str, value)
+
+
+@lru_cache(maxsize=_VALIDATION_CACHE_SIZE)
+def _validate_date_str(str_value: str) -> Dict[str, Any]:
+    """Validate a stripped date string (memoized; callers receive a copy)."""
+    # Check for Excel serial date first. Only strings float() could accept (a leading
+    # digit, sign, point, or nan/inf spelling) pay for the try/except
+    first_char = str_value[:1]
+    if first_char.isdecimal() or first_char in _FLOAT_LEADING_CHARS:
+        try:
+            float_val = float(str_value)
+            if 1 <= float_val <= 100000:  # Reasonable Excel date range
+                return {
+                    'is_valid': True,
+                    'pattern': 'excel_serial',
+                    'parsed_value': float_val
+                }
+        except ValueError:
+            pass
+    
+    # Every remaining format needs a day or year digit; reject the rest before the
+    # regex and, above all, before dateutil
+    if len(str_value) < _MIN_DATE_LENGTH or not _DIGIT_RE.search(str_value):
         return {
             'is_valid': False,
-            'error': 'Empty or null value',
+            'error': f'Invalid date format: {str_value}',
             'parsed_value': None
         }
     
-    # Common date patterns
-    patterns = {
-        'mm_dd_yyyy': r'^\d{1,2}/\d{1,2}/\d{4}$',
-        'dd_mm_yyyy': r'^\d{1,2}/\d{1,2}/\d{4}$',
-        'yyyy_mm_dd': r'^\d{4}-\d{1,2}-\d{1,2}$',
-        'dd_mon_yyyy': r'^\d{1,2}-\w{3}-\d{4}$',
-        'quarter': r'^Q[1-4]\s+\d{4}$',
-        'quarter_short': r'^Q[1-4]-\d{2}$',
-        'month_year': r'^\w+\s+\d{4}$',
-        'excel_serial': r'^\d{5}$'  # Excel serial dates are typically 5 digits
-    }
-    
-    str_value = str(value).strip()
-    
-    # Check for Excel serial date first
-    try:
-        float_val = float(str_value)
-        if 1 <= float_val <= 100000:  # Reasonable Excel date range
-            return {
-                'is_valid': True,
-                'pattern': 'excel_serial',
-                'parsed_value': float_val
-            }
-    except ValueError:
-        pass
-    
     # Check other patterns
-    for pattern_name, pattern in patterns.items():
-        if re.match(pattern, str_value, re.IGNORECASE):
-            return {
-                'is_valid': True,
-                'pattern': pattern_name,
-                'parsed_value': str_value
-            }
+    match = _DATE_FORMAT_RE.match(str_value)
+    if match:
+        pattern = match.lastgroup
+        if pattern == 'mm_dd_yyyy' and int(str_value.split('/', 1)[0]) > 12:
+            pattern = 'dd_mm_yyyy'
+        return {
+            'is_valid': True,
+            'pattern': pattern,
+            'parsed_value': str_value
+        }
     
     # Try dateutil parser as fallback
     try:
@@ -121,6 +227,50 @@ def validate_date_format(value: str) -> Dict[str, Any]:
     }
 
 
+def _date_prefilter(values: np.ndarray) -> Dict[str, np.ndarray]:
+    """
+    Settle distinct strings whose date validity follows from their characters alone.
+    
+    Values are laid out as a matrix of UTF-32 code points and scanned once.
+    All-ASCII values without a digit can never validate. Values that exactly fit a
+    _DATE_SURE_SHAPES layout always do.
+    
+    Args:
+        values: Object array of distinct strings
+        
+    Returns:
+        Dictionary with 'valid' and 'invalid' boolean arrays; values flagged in
+        neither still need validate_date_format
+    """
+    valid = np.zeros(len(values), dtype=bool)
+    invalid = np.zeros(len(values), dtype=bool)
+    
+    lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values))
+    rows = np.flatnonzero(lengths <= _DATE_PREFILTER_MAX_WIDTH)
+    if len(rows) == 0:
+        return {'valid': valid, 'invalid': invalid}
+    
+    width = max(int(lengths[rows].max()), 1)
+    codes = values[rows].astype(f'<U{width}').view(np.uint32).reshape(len(rows), width)
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    
+    # Non-ASCII values may hold other Unicode digits, which the date checks accept
+    invalid[rows] = ~is_digit.any(axis=1) & (codes < 128).all(axis=1)
+    
+    for shape in _DATE_SURE_SHAPES:
+        if len(shape) > width:
+            continue
+        fits = lengths[rows] == len(shape)
+        for position, char in enumerate(shape):
+            if char == '9':
+                fits &= is_digit[:, position]
+            else:
+                fits &= codes[:, position] == ord(char)
+        valid[rows] |= fits
+    
+    return {'valid': valid, 'invalid': invalid}
+
+
 def validate_column_data_type(series: pd.Series, expected_type: str) -> Dict[str, Any]:
     """
     Validate if a column matches the expected data type.
@@ -139,10 +289,12 @@ def validate_column_data_type(series: pd.Series, expected_type: str) -> Dict[str
             'match_percentage': 0.0
         }
     
-    # Remove null values for analysis
-    clean_series = series.dropna()
+    # Null values are excluded through one mask; the values are only copied out
+    # where a branch needs them
+    non_null = series.notna()
+    non_null_count = non_null.sum()
     
-    if len(clean_series) == 0:
+    if non_null_count == 0:
         return {
             'is_valid': False,
             'error': 'Series contains only null values',
@@ -150,23 +302,45 @@ def validate_column_data_type(series: pd.Series, expected_type: str) -> Dict[str
         }
     
     valid_count = 0
-    total_count = len(clean_series)
+    total_count = int(non_null_count)
     
     if expected_type == 'number':
-        # Check if values can be converted to numeric
-        numeric_series = pd.to_numeric(clean_series, errors='coerce')
-        valid_count = numeric_series.notna().sum()
+        if pd.api.types.is_numeric_dtype(series):
+            # to_numeric keeps numeric values as they are, so every non-null one is valid
+            valid_count = non_null_count
+        else:
+            # Check if values can be converted to numeric (masked, as to_numeric turns
+            # NaT into integers)
+            numeric_series = pd.to_numeric(series, errors='coerce')
+            valid_count = (numeric_series.notna() & non_null).sum()
     
     elif expected_type == 'date':
-        # Check if values can be parsed as dates
-        for value in clean_series:
-            if validate_date_format(str(value))['is_valid']:
-                valid_count += 1
+        if pd.api.types.is_datetime64_any_dtype(series):
+            # Already parsed: every timestamp's str() form validates
+            valid_count = total_count
+        else:
+            # Check each distinct string once and weight it by how often it occurs
+            codes, uniques = pd.factorize(series[non_null].astype(str))
+            counts = np.bincount(codes, minlength=len(uniques))
+            uniques = np.asarray(uniques, dtype=object)
+            prefilter = _date_prefilter(uniques)
+            is_valid = prefilter['valid']
+            # Only values the code-point scan could not settle reach the Python validator
+            undecided = np.flatnonzero(~(prefilter['valid'] | prefilter['invalid']))
+            is_valid[undecided] = np.fromiter(
+                (validate_date_format(value)['is_valid'] for value in uniques[undecided]),
+                dtype=bool, count=len(undecided))
+            valid_count = int(counts[is_valid].sum())
     
     elif expected_type == 'string':
         # String type is always valid (everything can be string)
         valid_count = total_count
     
+    return _type_match_result(valid_count, total_count, expected_type)
+
+
+def _type_match_result(valid_count: int, total_count: int, expected_type: str) -> Dict[str, Any]:
+    """Build the validate_column_data_type result for a column with non-null values."""
     match_percentage = (valid_count / total_count) * 100
     
     return {
@@ -202,12 +376,35 @@ def validate_dataframe_schema(df: pd.DataFrame, schema: Dict[str, str]) -> Dict[
         validation_result['errors'].append(f'Missing columns: {list(missing_columns)}')
         validation_result['is_valid'] = False
     
+    present = [(column, expected_type) for column, expected_type in schema.items() if column in df.columns]
+    
+    # Non-null counts for every schema column in one pass, and the number columns
+    # that are not numeric already coerced as one block; string columns need no
+    # parsing at all (masked by the non-null frame, as to_numeric turns NaT into integers)
+    non_null = df[[column for column, _ in present]].notna()
+    non_null_counts = non_null.sum()
+    number_columns = [column for column, expected_type in present
+                      if expected_type == 'number' and non_null_counts[column] > 0
+                      and not pd.api.types.is_numeric_dtype(df[column])]
+    numeric_counts = ((df[number_columns].apply(pd.to_numeric, errors='coerce').notna()
+                       & non_null[number_columns]).sum()
+                      if number_columns else pd.Series(dtype='int64'))
+    
     # Validate each column
-    for column, expected_type in schema.items():
-        if column not in df.columns:
-            continue
-        
-        col_validation = validate_column_data_type(df[column], expected_type)
+    for column, expected_type in present:
+        total_count = int(non_null_counts[column])
+        if total_count == 0:
+            # Empty or all-null columns get validate_column_data_type's error result
+            col_validation = validate_column_data_type(df[column], expected_type)
+        elif expected_type == 'number':
+            # Numeric-dtype columns were not coerced: every non-null value is valid
+            valid_count = (numeric_counts[column] if column in numeric_counts
+                           else non_null_counts[column])
+            col_validation = _type_match_result(valid_count, total_count, expected_type)
+        elif expected_type == 'string':
+            col_validation = _type_match_result(total_count, total_count, expected_type)
+        else:
+            col_validation = validate_column_data_type(df[column], expected_type)
         validation_result['column_validations'][column] = col_validation
         
         if not col_validation['is_valid']:
@@ -243,8 +440,12 @@ def validate_financial_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
     
     checks = []
     
+    # Null counts come from one NumPy mask reduction shared by the empty-column and
+    # null-percentage checks (count_nonzero counts the bools without an integer cast)
+    null_counts = np.count_nonzero(df.isna().to_numpy(), axis=0)
+    
     # Check 1: No completely empty columns
-    empty_columns = df.columns[df.isnull().all()].tolist()
+    empty_columns = df.columns[null_counts == len(df)].tolist()
     if empty_columns:
         quality_report['issues'].append(f'Empty columns found: {empty_columns}')
     else:
@@ -260,19 +461,19 @@ def validate_financial_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
     quality_report['total_checks'] += 1
     
     # Check 3: Reasonable null percentage (< 50%)
-    null_percentages = (df.isnull().sum() / len(df)) * 100
-    high_null_columns = null_percentages[null_percentages > 50].index.tolist()
+    # More than half null, compared in integers (no division, so no 0/0 on empty frames)
+    high_null_columns = df.columns[null_counts * 2 > len(df)].tolist()
     if high_null_columns:
         quality_report['issues'].append(f'High null percentage columns: {high_null_columns}')
     else:
         quality_report['checks_passed'] += 1
     quality_report['total_checks'] += 1
     
+    # Column names are lowercased once for both keyword checks below
+    lowered_names = [(col, str(col).lower()) for col in df.columns]
+    
     # Check 4: Date columns are valid dates
-    date_columns = []
-    for col in df.columns:
-        if any(keyword in col.lower() for keyword in ['date', 'time', 'created', 'updated']):
-            date_columns.append(col)
+    date_columns = [col for col, name in lowered_names if _DATE_COLUMN_RE.search(name)]
     
     if date_columns:
         date_validation_passed = True
@@ -287,10 +488,7 @@ def validate_financial_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
         quality_report['total_checks'] += 1
     
     # Check 5: Amount columns are numeric
-    amount_columns = []
-    for col in df.columns:
-        if any(keyword in col.lower() for keyword in ['amount', 'value', 'price', 'cost', 'revenue', 'balance']):
-            amount_columns.append(col)
+    amount_columns = [col for col, name in lowered_names if _AMOUNT_COLUMN_RE.search(name)]
     
     if amount_columns:
         amount_validation_passed = True
@@ -323,6 +521,87 @@ def validate_financial_data_quality(df: pd.DataFrame) -> Dict[str, Any]:
     return quality_report
 
 
+def _read_xlsx_sheet_names(file_path: str) -> List[str]:
+    """
+    Read an .xlsx workbook's sheet names straight from its workbook part.
+    
+    Only _rels/.rels and the workbook XML are parsed; no cells, shared strings or
+    styles are loaded.
+    
+    Args:
+        file_path: Path to the .xlsx file
+        
+    Returns:
+        Sheet names in workbook order
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        # The package relationships name the workbook part (almost always xl/workbook.xml)
+        workbook_part = _DEFAULT_WORKBOOK_PART
+        rels = ET.fromstring(archive.read('_rels/.rels'))
+        for relationship in rels:
+            if relationship.get('Type', '').endswith('/officeDocument'):
+                workbook_part = relationship.get('Target', workbook_part).lstrip('/')
+                break
+        
+        workbook = ET.fromstring(archive.read(workbook_part))
+    
+    return [element.get('name') for element in workbook.iter() if element.tag.endswith('}sheet')]
+
+
+def _has_tokenizer_quirks(record: List[str]) -> bool:
+    """Check parsed fields for quote characters or NULs, which pandas tokenizes differently."""
+    return any('"' in field or '\x00' in field for field in record)
+
+
+def _lf_lines(handle) -> Iterator[str]:
+    """Yield a text file's lines, refusing bare CR line endings (pandas splits those differently)."""
+    for line in handle:
+        if line.endswith('\r'):
+            raise csv.Error('bare carriage return line ending')
+        yield line
+
+
+def _read_csv_preview(file_path: str, rows: int = _CSV_PREVIEW_ROWS) -> Optional[Dict[str, Any]]:
+    """
+    Read a CSV file's header and count its first data rows with the csv module.
+    
+    Uses pandas' default dialect (comma separated, double-quoted, UTF-8) and gives the
+    same columns and row count as pd.read_csv(file_path, nrows=rows) for plain files.
+    
+    Args:
+        file_path: Path to the CSV file
+        rows: Maximum number of data rows to count
+        
+    Returns:
+        Dictionary with 'columns' and 'sample_rows', or None when the file needs
+        pandas' own handling (no header, blank or duplicate column names, rows wider
+        than the header, whitespace-only lines, quote characters or NULs in fields,
+        bare CR line endings, or content the strict csv module rejects)
+    """
+    try:
+        with open(file_path, newline='', encoding='utf-8-sig') as handle:
+            # Blank lines come back as empty records; pandas skips them too
+            records = (record for record in csv.reader(_lf_lines(handle), strict=True) if record)
+            columns = next(records, None)
+            if (not columns or '' in columns or len(set(columns)) != len(columns)
+                    or not columns[0].strip() or _has_tokenizer_quirks(columns)):
+                return None
+            
+            sample_rows = 0
+            for record in records:
+                # Whitespace-only lines may or may not be blank to pandas' tokenizer
+                if (len(record) > len(columns) or (len(record) == 1 and not record[0].strip())
+                        or _has_tokenizer_quirks(record)):
+                    return None
+                sample_rows += 1
+                if sample_rows == rows:
+                    break
+    except (csv.Error, UnicodeDecodeError):
+        return None
+    
+    return {'columns': columns, 'sample_rows': sample_rows}
+
+
 def validate_file_format(file_path: str) -> Dict[str, Any]:
     """
     Validate file format and structure.
@@ -342,8 +621,11 @@ def validate_file_format(file_path: str) -> Dict[str, Any]:
         'file_info': {}
     }
     
-    # Check if file exists
-    if not os.path.exists(file_path):
+    # Check if file exists; the one stat result also supplies the file information
+    # below (os.path.exists likewise reports any OSError/ValueError as missing)
+    try:
+        stat = os.stat(file_path)
+    except (OSError, ValueError):
         validation_result['error'] = 'File does not exist'
         return validation_result
     
@@ -353,13 +635,12 @@ def validate_file_format(file_path: str) -> Dict[str, Any]:
     # Validate Excel files
     if file_ext in ['.xlsx', '.xls']:
         try:
-            import openpyxl
-            workbook = openpyxl.load_workbook(file_path, read_only=True)
+            sheets = _read_xlsx_sheet_names(file_path)
             validation_result.update({
                 'is_valid': True,
                 'file_type': 'excel',
-                'sheets': workbook.sheetnames,
-                'sheet_count': len(workbook.sheetnames)
+                'sheets': sheets,
+                'sheet_count': len(sheets)
             })
         except Exception as e:
             validation_result['error'] = f'Invalid Excel file: {str(e)}'
@@ -367,12 +648,14 @@ def validate_file_format(file_path: str) -> Dict[str, Any]:
     # Validate CSV files
     elif file_ext == '.csv':
         try:
-            df = pd.read_csv(file_path, nrows=5)  # Read first 5 rows to validate
+            preview = _read_csv_preview(file_path)
+            if preview is None:
+                df = pd.read_csv(file_path, nrows=_CSV_PREVIEW_ROWS)  # Read first rows to validate
+                preview = {'columns': list(df.columns), 'sample_rows': len(df)}
             validation_result.update({
                 'is_valid': True,
                 'file_type': 'csv',
-                'columns': list(df.columns),
-                'sample_rows': len(df)
+                **preview
             })
         except Exception as e:
             validation_result['error'] = f'Invalid CSV file: {str(e)}'
@@ -382,7 +665,6 @@ def validate_file_format(file_path: str) -> Dict[str, Any]:
     
     # Add file information
     if validation_result['is_valid']:
-        stat = os.stat(file_path)
         validation_result['file_info'] = {
             'size_bytes': stat.st_size,
             'size_mb': round(stat.st_size / (1024 * 1024), 2),
@@ -0,0 +1,304 @@
+import unittest
+from unittest.mock import patch
+import pandas as pd
+import numpy as np
+from src.core.data_storage import DataStorage
+
+
+class TestDataStorage(unittest.TestCase):
+    """Test cases for DataStorage class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.sample_data = pd.DataFrame({
+            'category': ['Revenue', 'Expense', 'Revenue', 'Asset', 'Revenue'],
+            'currency': ['USD', 'EUR', 'EUR', 'USD', 'USD'],
+            'amount': [100.0, 250.0, 1500.0, 75.5, 980.0]
+        })
+
+    def test_query_by_criteria_all_strategies(self):
+        """Test that every storage strategy returns the same filtered rows."""
+        filters = {'category': 'Revenue', 'amount': {'min': 500}}
+
+        for strategy in ['pandas', 'sqlite', 'dict']:
+            storage = DataStorage(storage_type=strategy)
+            dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+
+            result = storage.query_by_criteria(filters, dataset_id)
+
+            self.assertListEqual(sorted(result['amount'].tolist()), [980.0, 1500.0], strategy)
+
+    def test_aggregate_data_all_strategies(self):
+        """Test aggregation across storage strategies."""
+        for strategy in ['pandas', 'sqlite', 'dict']:
+            storage = DataStorage(storage_type=strategy)
+            dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+
+            result = storage.aggregate_data(['currency'], ['amount:sum'], dataset_id)
+            totals = dict(zip(result['currency'], result['amount']))
+
+            self.assertAlmostEqual(totals['USD'], 1155.5)
+            self.assertAlmostEqual(totals['EUR'], 1750.0)
+
+    def test_aggregate_categorized_columns_observed_groups(self):
+        """Test that grouping by categorized columns returns only the combinations present."""
+        results = []
+        for threshold in (0, 1.0):
+            storage = DataStorage(storage_type='pandas', categorize_threshold=threshold)
+            dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+            result = storage.aggregate_data(['category', 'currency'], ['amount:sum'], dataset_id)
+            results.append(result.astype({'category': object, 'currency': object}))
+        
+        self.assertIsInstance(storage.get_dataset_info(dataset_id)['dtypes']['category'], pd.CategoricalDtype)
+        self.assertEqual(len(results[1]), 4)
+        pd.testing.assert_frame_equal(results[1], results[0])
+
+    def test_categorical_columns_use_codes(self):
+        """Test that categorical columns skip index building and filter by codes."""
+        data = self.sample_data.astype({'category': 'category'})
+        storage = DataStorage(storage_type='pandas')
+        dataset_id = storage.store_data(data, {'source': 'test'})
+        
+        index_info = storage.create_indexes(['category', 'amount'], dataset_id)[dataset_id]
+        
+        self.assertEqual(index_info['category']['type'], 'categorical')
+        self.assertEqual(index_info['amount']['type'], 'sorted_index')
+        self.assertEqual(len(storage.query_by_criteria({'category': 'Revenue'}, dataset_id)), 3)
+        self.assertTrue(storage.query_by_criteria({'category': 'Liability'}, dataset_id).empty)
+
+    def test_pandas_storage_categorizes_low_cardinality_strings(self):
+        """Test that repetitive string columns are stored as categoricals."""
+        storage = DataStorage(storage_type='pandas')
+        dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+        dtypes = storage.get_dataset_info(dataset_id)['dtypes']
+        
+        self.assertIsInstance(dtypes['currency'], pd.CategoricalDtype)
+        self.assertNotIsInstance(dtypes['category'], pd.CategoricalDtype)
+        
+        result = storage.query_by_criteria({'currency': {'min': 'EUR', 'max': 'EUR'}}, dataset_id)
+        self.assertListEqual(result['amount'].tolist(), [250.0, 1500.0])
+        
+        storage = DataStorage(storage_type='pandas', categorize_threshold=0)
+        dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+        self.assertNotIsInstance(storage.get_dataset_info(dataset_id)['dtypes']['currency'], pd.CategoricalDtype)
+
+    def test_pandas_storage_isolated_from_caller_mutation(self):
+        """Test that stored frames are unaffected when the caller mutates its frame."""
+        data = self.sample_data.copy()
+        storage = DataStorage(storage_type='pandas')
+        dataset_id = storage.store_data(data, {'source': 'test'})
+        
+        data.loc[0, 'amount'] = -1.0
+        
+        result = storage.query_by_criteria({'amount': {'max': 0}}, dataset_id)
+        self.assertTrue(result.empty)
+
+    def test_store_data_copies_without_copy_on_write(self):
+        """Test that frames are deep-copied by default unless Copy-on-Write is active."""
+        for storage_type in ('pandas', 'dict'):
+            storage = DataStorage(storage_type=storage_type)
+            with patch('src.core.data_storage._copy_on_write_enabled', return_value=False):
+                copied = storage.store_data(self.sample_data, {'source': 'test'})
+                shared = storage.store_data(self.sample_data, {'source': 'test'}, copy=False)
+            
+            def stored_amounts(dataset_id):
+                stored = storage.data[dataset_id]
+                return (stored['frame'] if storage_type == 'dict' else stored)['amount'].to_numpy()
+            
+            source = self.sample_data['amount'].to_numpy()
+            self.assertFalse(np.shares_memory(stored_amounts(copied), source), storage_type)
+            self.assertTrue(np.shares_memory(stored_amounts(shared), source), storage_type)
+
+    def test_indexed_pandas_query_matches_scan(self):
+        """Test that hash-indexed equality and 'in' filters match an unindexed scan."""
+        filters = {'currency': 'USD', 'category': {'in': ['Revenue', 'Asset']}, 'amount': {'max': 500}}
+        storage = DataStorage(storage_type='pandas')
+        dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+        expected = storage.query_by_criteria(filters, dataset_id)
+        
+        storage.create_indexes(['currency', 'category'], dataset_id)
+        result = storage.query_by_criteria(filters, dataset_id)
+        
+        self.assertListEqual(result.index.tolist(), [0, 3])
+        pd.testing.assert_frame_equal(result, expected)
+        self.assertTrue(storage.query_by_criteria({'currency': 'GBP'}, dataset_id).empty)
+
+    def test_dict_indexes_group_positions(self):
+        """Test that dict storage indexes map each value to its record positions."""
+        storage = DataStorage(storage_type='dict')
+        dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+        
+        index_info = storage.create_indexes(['currency'], dataset_id)[dataset_id]
+        value_index = index_info['currency']['value_index']
+        
+        self.assertListEqual(list(value_index['USD']), [0, 3, 4])
+        self.assertListEqual(list(value_index['EUR']), [1, 2])
+
+    def test_dict_query_date_range(self):
+        """Test dict storage range filters on datetime columns with string bounds."""
+        data = self.sample_data.assign(date=pd.date_range('2023-01-01', periods=5))
+        storage = DataStorage(storage_type='dict')
+        dataset_id = storage.store_data(data, {'source': 'test'})
+        
+        result = storage.query_by_criteria({'date': {'min': '2023-01-02', 'max': '2023-01-03'}}, dataset_id)
+        
+        self.assertListEqual(result['amount'].tolist(), [250.0, 1500.0])
+
+    def test_query_all_datasets(self):
+        """Test querying across several datasets tags rows with their dataset id."""
+        for strategy in ['pandas', 'sqlite', 'dict']:
+            storage = DataStorage(storage_type=strategy)
+            dataset_ids = [storage.store_data(self.sample_data, {'source': 'test'}) for _ in range(3)]
+            
+            result = storage.query_by_criteria({'currency': 'EUR'})
+            
+            self.assertEqual(len(result), 6, strategy)
+            self.assertListEqual(result['dataset_id'].unique().tolist(), dataset_ids)
+
+    def test_query_by_criteria_stream(self):
+        """Test that streamed query chunks add up to the full result."""
+        filters = {'currency': 'USD'}
+        
+        for strategy in ['pandas', 'sqlite', 'dict']:
+            storage = DataStorage(storage_type=strategy)
+            dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+            
+            chunks = list(storage.query_by_criteria(filters, dataset_id, stream=True))
+            streamed = pd.concat(chunks, ignore_index=True)
+            
+            self.assertListEqual(streamed['amount'].tolist(), [100.0, 75.5, 980.0], strategy)
+            self.assertListEqual(list(storage.query_by_criteria({'currency': 'GBP'}, stream=True)), [])
+
+    def test_sqlite_aggregate_matches_pandas(self):
+        """Test that SQLite GROUP BY aggregation matches the pandas path."""
+        measures = ['amount:mean', 'category:count']
+        results = []
+        for strategy in ['pandas', 'sqlite']:
+            storage = DataStorage(storage_type=strategy)
+            dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+            results.append(storage.aggregate_data(['currency'], measures, dataset_id))
+        
+        self.assertListEqual(results[0]['currency'].tolist(), results[1]['currency'].tolist())
+        self.assertListEqual(results[0]['category'].tolist(), results[1]['category'].tolist())
+        for expected, actual in zip(results[0]['amount'], results[1]['amount']):
+            self.assertAlmostEqual(expected, actual)
+
+    def test_aggregate_data_cached_until_new_data(self):
+        """Test that repeated aggregations reuse results until the data changes."""
+        storage = DataStorage(storage_type='pandas')
+        storage.store_data(self.sample_data, {'source': 'test'})
+        
+        first = storage.aggregate_data(['currency'], ['amount:sum'])
+        first.loc[0, 'amount'] = 0.0
+        first['amount'] = 0.0
+        second = storage.aggregate_data(['currency'], ['amount:sum'])
+        self.assertEqual(len(storage._agg_cache), 1)
+        self.assertAlmostEqual(second['amount'].sum(), 2905.5)
+        
+        # Results own their data, so in-place changes cannot reach the cache without Copy-on-Write
+        cached = next(iter(storage._agg_cache.values()))
+        self.assertFalse(np.shares_memory(second['amount'].to_numpy(), cached['amount'].to_numpy()))
+        
+        storage.store_data(self.sample_data, {'source': 'test'})
+        third = storage.aggregate_data(['currency'], ['amount:sum'])
+        self.assertAlmostEqual(third['amount'].sum(), 5811.0)
+
+    def test_aggregate_all_datasets_leaves_data_unchanged(self):
+        """Test that aggregating across datasets does not modify stored or cached frames."""
+        for strategy in ['pandas', 'sqlite', 'dict']:
+            storage = DataStorage(storage_type=strategy)
+            dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+            
+            first = storage.aggregate_data(['currency'], ['amount:sum'])
+            second = storage.aggregate_data(['currency'], ['amount:sum'])
+            
+            pd.testing.assert_frame_equal(first, second)
+            self.assertNotIn('dataset_id', storage.get_dataset_info(dataset_id)['columns'], strategy)
+
+    def test_sqlite_query_binds_parameters(self):
+        """Test SQLite filters with quoted strings and datetime bounds."""
+        data = self.sample_data.assign(
+            date=pd.date_range('2023-01-01', periods=5),
+            category=['Revenue', "Owner's Equity", 'Revenue', 'Asset', 'Revenue']
+        )
+        storage = DataStorage(storage_type='sqlite')
+        dataset_id = storage.store_data(data, {'source': 'test'})
+        
+        result = storage.query_by_criteria({'category': "Owner's Equity"}, dataset_id)
+        self.assertListEqual(result['amount'].tolist(), [250.0])
+        
+        result = storage.query_by_criteria({'date': {'min': '2023-01-02', 'max': '2023-01-03'}}, dataset_id)
+        self.assertListEqual(result['amount'].tolist(), [250.0, 1500.0])
+
+    def test_sqlite_query_validates_columns(self):
+        """Test SQLite filters on spaced column names and on keys that are not columns."""
+        data = self.sample_data.rename(columns={'category': 'Account Category'})
+        storage = DataStorage(storage_type='sqlite')
+        dataset_id = storage.store_data(data, {'source': 'test'})
+        
+        result = storage.query_by_criteria({'Account Category': 'Asset'}, dataset_id)
+        self.assertListEqual(result['amount'].tolist(), [75.5])
+        
+        result = storage.query_by_criteria({'Account Category': 'Asset', '1=1 OR amount': 0}, dataset_id)
+        self.assertListEqual(result['amount'].tolist(), [75.5])
+
+    def test_explain_query_uses_index(self):
+        """Test that SQLite query plans pick up created indexes."""
+        storage = DataStorage(storage_type='sqlite')
+        dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+        storage.create_indexes(['category'], dataset_id)
+
+        plan = storage.explain_query({'category': 'Revenue'}, dataset_id)
+
+        self.assertTrue(any('INDEX' in step for step in plan))
+        stats = storage.db_connection.execute("SELECT idx FROM sqlite_stat1").fetchall()
+        self.assertIn((storage.indexes[dataset_id]['category']['index_name'],), stats)
+
+    def test_sqlite_datasets_share_table(self):
+        """Test that same-shaped SQLite datasets share a table but keep their own rows."""
+        storage = DataStorage(storage_type='sqlite')
+        first_id = storage.store_data(self.sample_data, {'source': 'test'})
+        second_id = storage.store_data(self.sample_data.head(2), {'source': 'test'})
+        
+        self.assertEqual(storage.data[first_id], storage.data[second_id])
+        self.assertEqual(storage.get_dataset_info(first_id)['row_count'], 5)
+        self.assertListEqual(storage.get_dataset_info(second_id)['columns'], list(self.sample_data.columns))
+        self.assertEqual(len(storage.query_by_criteria({'currency': 'EUR'}, second_id)), 1)
+
+    def test_sqlite_datasets_with_different_types(self):
+        """Test that same-named columns with different types do not share a table."""
+        numeric = pd.DataFrame({'acct': [1, 2], 'amt': [1.5, 2.5]})
+        text = pd.DataFrame({'acct': ['00123', '0042'], 'amt': ['1e3', 'x']})
+        storage = DataStorage(storage_type='sqlite')
+        numeric_id = storage.store_data(numeric, {'source': 'test'})
+        text_id = storage.store_data(text, {'source': 'test'})
+        
+        self.assertNotEqual(storage.data[numeric_id], storage.data[text_id])
+        self.assertListEqual(storage.query_by_criteria({}, numeric_id)['amt'].tolist(), [1.5, 2.5])
+        result = storage.query_by_criteria({}, text_id)
+        self.assertListEqual(result['acct'].tolist(), ['00123', '0042'])
+        self.assertListEqual(result['amt'].tolist(), ['1e3', 'x'])
+
+    def test_sqlite_indexes_validate_columns(self):
+        """Test SQLite index creation with spaced, unknown and repeated columns."""
+        data = self.sample_data.rename(columns={'category': 'Account Category'})
+        storage = DataStorage(storage_type='sqlite')
+        dataset_id = storage.store_data(data, {'source': 'test'})
+        
+        index_info = storage.create_indexes(['Account Category', 'amount); DROP TABLE x; --'], dataset_id)
+        repeated = storage.create_indexes(['Account Category'], dataset_id)
+        
+        self.assertIn('index_name', index_info[dataset_id]['Account Category'])
+        self.assertIn('error', index_info[dataset_id]['amount); DROP TABLE x; --'])
+        self.assertIn('index_name', repeated[dataset_id]['Account Category'])
+
+    def test_explain_query_non_sqlite(self):
+        """Test that query plans are empty for non-SQLite storage."""
+        storage = DataStorage(storage_type='pandas')
+        dataset_id = storage.store_data(self.sample_data, {'source': 'test'})
+
+        self.assertEqual(storage.explain_query({'category': 'Revenue'}, dataset_id), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,6 @@
 import unittest
 import pandas as pd
+import numpy as np
 import tempfile
 import os
 from src.core.excel_processor import ExcelProcessor
@@ -8,50 +9,48 @@ from src.core.excel_processor import ExcelProcessor
 class TestExcelProcessor(unittest.TestCase):
     """Test cases for ExcelProcessor class."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.processor = ExcelProcessor()
-        
+    @classmethod
+    def setUpClass(cls):
+        """Write the sample workbook once; no test modifies it."""
         # Create a temporary Excel file for testing
-        self.temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
-        self.temp_file.close()
+        cls.temp_file = tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False)
+        cls.temp_file.close()
         
         # Create sample data
-        self.sample_data = pd.DataFrame({
+        cls.sample_data = pd.DataFrame({
             'A': [1, 2, 3, 4, 5],
             'B': ['a', 'b', 'c', 'd', 'e'],
             'C': [1.1, 2.2, 3.3, 4.4, 5.5]
         })
         
         # Save to Excel file
-        with pd.ExcelWriter(self.temp_file.name, engine='openpyxl') as writer:
-            self.sample_data.to_excel(writer, sheet_name='Sheet1', index=False)
-            self.sample_data.to_excel(writer, sheet_name='Sheet2', index=False)
+        with pd.ExcelWriter(cls.temp_file.name, engine='openpyxl') as writer:
+            cls.sample_data.to_excel(writer, sheet_name='Sheet1', index=False)
+            cls.sample_data.to_excel(writer, sheet_name='Sheet2', index=False)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        # Close any open workbooks to release file handles
-        for file_info in self.processor.loaded_files.values():
-            if 'workbook' in file_info:
-                try:
-                    file_info['workbook'].close()
-                except:
-                    pass
-        
-        # Clear loaded files
-        self.processor.loaded_files.clear()
-        self.processor.file_info.clear()
-        
+    @classmethod
+    def tearDownClass(cls):
+        """Delete the sample workbook."""
         # Try to delete temp file with retry logic for Windows
-        if os.path.exists(self.temp_file.name):
+        if os.path.exists(cls.temp_file.name):
             import time
             for _ in range(3):  # Try 3 times
                 try:
-                    os.unlink(self.temp_file.name)
+                    os.unlink(cls.temp_file.name)
                     break
                 except PermissionError:
                     time.sleep(0.1)  # Wait 100ms before retry
     
+    def setUp(self):
+        """Set up test fixtures."""
+        self.processor = ExcelProcessor()
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        # Clear loaded files
+        self.processor.loaded_files.clear()
+        self.processor.file_info.clear()
+    
     def test_load_files(self):
         """Test loading Excel files."""
         # Test loading a single file
@@ -62,6 +61,14 @@ class TestExcelProcessor(unittest.TestCase):
         self.assertIn('Sheet1', file_info[self.temp_file.name]['sheets'])
         self.assertIn('Sheet2', file_info[self.temp_file.name]['sheets'])
     
+    def test_load_files_keeps_no_open_handles(self):
+        """Test that loaded files hold metadata only, not open readers."""
+        file_info = self.processor.load_files([self.temp_file.name])[self.temp_file.name]
+        
+        self.assertNotIn('excel_file', file_info)
+        self.assertNotIn('workbook', file_info)
+        self.assertEqual(file_info['file_size'], os.path.getsize(self.temp_file.name))
+    
     def test_load_files_file_not_found(self):
         """Test loading non-existent file."""
         with self.assertRaises(FileNotFoundError):
@@ -80,6 +87,36 @@ class TestExcelProcessor(unittest.TestCase):
         self.assertEqual(sheet_info['Sheet1']['column_count'], 3)
         self.assertEqual(sheet_info['Sheet1']['sample_rows'], 5)
     
+    def test_get_sheet_info_without_dimension_record(self):
+        """Test sizing sheets whose XML has no stored <dimension> element."""
+        import re
+        import zipfile
+        
+        stripped = self.temp_file.name + '.nodim.xlsx'
+        with zipfile.ZipFile(self.temp_file.name) as source, zipfile.ZipFile(stripped, 'w') as target:
+            for item in source.infolist():
+                data = source.read(item.filename)
+                if item.filename.startswith('xl/worksheets/'):
+                    data = re.sub(rb'<dimension[^>]*/>', b'', data)
+                target.writestr(item, data)
+        
+        try:
+            self.processor.load_files([stripped])
+            sheet_info = self.processor.get_sheet_info(stripped)
+            self.assertEqual(sheet_info['Sheet1']['dimensions'], 'Rows: 6, Columns: 3')
+        finally:
+            del self.processor.loaded_files[stripped]
+            os.unlink(stripped)
+    
+    def test_get_sheet_names(self):
+        """Test getting sheet names without reading sheet data."""
+        self.processor.load_files([self.temp_file.name])
+        
+        self.assertListEqual(self.processor.get_sheet_names(self.temp_file.name), ['Sheet1', 'Sheet2'])
+        
+        with self.assertRaises(ValueError):
+            self.processor.get_sheet_names('nonexistent.xlsx')
+    
     def test_get_sheet_info_file_not_loaded(self):
         """Test getting sheet info for unloaded file."""
         with self.assertRaises(ValueError):
@@ -124,11 +161,67 @@ class TestExcelProcessor(unittest.TestCase):
         # Get all sheets data
         all_data = self.processor.get_all_sheets_data(self.temp_file.name)
         
-        self.assertIn('Sheet1', all_data)
-        self.assertIn('Sheet2', all_data)
+        self.assertEqual(list(all_data), ['Sheet1', 'Sheet2'])
         self.assertEqual(len(all_data['Sheet1']), 5)
         self.assertEqual(len(all_data['Sheet2']), 5)
 
+    def test_get_all_sheets_data_cached(self):
+        """Test that sheet data is read once per loaded file."""
+        self.processor.load_files([self.temp_file.name])
+        
+        first = self.processor.get_all_sheets_data(self.temp_file.name)
+        cached = self.processor._sheets_cache[self.temp_file.name]['Sheet1']
+        second = self.processor.get_all_sheets_data(self.temp_file.name)
+        
+        self.assertIs(self.processor._sheets_cache[self.temp_file.name]['Sheet1'], cached)
+        pd.testing.assert_frame_equal(first['Sheet1'], second['Sheet1'])
+        
+        # Callers get their own frames, so changes do not reach the cache
+        first['Sheet1'].iloc[0, 2] = -1.0
+        first['Sheet1']['extra'] = 1
+        first.pop('Sheet1')
+        third = self.processor.get_all_sheets_data(self.temp_file.name)
+        
+        pd.testing.assert_frame_equal(third['Sheet1'], second['Sheet1'])
+        self.assertFalse(np.shares_memory(third['Sheet1']['C'].to_numpy(), cached['C'].to_numpy()))
+        
+        # Reloading the file refreshes the cache
+        self.processor.load_files([self.temp_file.name])
+        self.processor.get_all_sheets_data(self.temp_file.name)
+        
+        self.assertIsNot(self.processor._sheets_cache[self.temp_file.name]['Sheet1'], cached)
+
+    def test_dtype_backend(self):
+        """Test that sheet data is read with the configured dtype backend."""
+        self.processor = ExcelProcessor(dtype_backend='numpy_nullable')
+        self.processor.load_files([self.temp_file.name])
+        
+        all_data = self.processor.get_all_sheets_data(self.temp_file.name)
+        preview = self.processor.preview_data(self.temp_file.name, 'Sheet1', rows=2)
+        
+        self.assertEqual(str(all_data['Sheet1']['A'].dtype), 'Int64')
+        self.assertEqual(str(all_data['Sheet2']['C'].dtype), 'Float64')
+        self.assertEqual(str(preview['A'].dtype), 'Int64')
+    
+    def test_workbook_disk_cache(self):
+        """Test that an unchanged workbook is restored from the on-disk cache."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            writer = ExcelProcessor(cache_dir=cache_dir)
+            writer.load_files([self.temp_file.name])
+            writer.get_all_sheets_data(self.temp_file.name)
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            
+            self.processor = ExcelProcessor(cache_dir=cache_dir)
+            file_info = self.processor.load_files([self.temp_file.name])[self.temp_file.name]
+            
+            # Sheet data is restored on a cache hit, before anything is read
+            self.assertIn(self.temp_file.name, self.processor._sheets_cache)
+            self.assertEqual(file_info['sheets'], ['Sheet1', 'Sheet2'])
+            all_data = self.processor.get_all_sheets_data(self.temp_file.name)
+            pd.testing.assert_frame_equal(all_data['Sheet1'], self.sample_data)
+            self.assertEqual(len(self.processor.preview_data(self.temp_file.name, 'Sheet2', rows=2)), 2)
+            self.assertIn('Rows: 6', self.processor.get_sheet_info(self.temp_file.name)['Sheet1']['dimensions'])
+
 
 if __name__ == '__main__':
     unittest.main() 
\ No newline at end of file
@@ -0,0 +1,226 @@
+import unittest
+import pandas as pd
+import numpy as np
+from datetime import datetime
+from decimal import Decimal
+from src.core.format_parser import FormatParser, to_decimal
+
+
+class TestFormatParser(unittest.TestCase):
+    """Test cases for FormatParser class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.parser = FormatParser()
+
+    def test_parse_amount_series(self):
+        """Test vectorized amount parsing over a Series."""
+        data = pd.Series(['$1,234.56', '€1.234,56', '(500.00)', '2.5M', '1234.56-', 'Invalid'])
+
+        result = self.parser.parse_amount_series(data)
+
+        self.assertListEqual(list(result.columns),
+                             ['parsed_value', 'currency', 'is_negative', 'abbreviation', 'error'])
+        self.assertAlmostEqual(result['parsed_value'][0], 1234.56)
+        self.assertEqual(result['currency'][0], 'USD')
+        self.assertAlmostEqual(result['parsed_value'][1], 1234.56)
+        self.assertEqual(result['currency'][1], 'EUR')
+        self.assertTrue(result['is_negative'][2])
+        self.assertEqual(result['parsed_value'][3], 2500000.0)
+        self.assertEqual(result['abbreviation'][3], 'M')
+        self.assertTrue(result['is_negative'][4])
+        self.assertTrue(np.isnan(result['parsed_value'][5]))
+        self.assertIsNotNone(result['error'][5])
+
+    def test_parse_amount_series_matches_parse_amount(self):
+        """Test that batch parsing agrees with scalar parsing."""
+        data = pd.Series(['$1,234.56', '(2,500.00)', '€1.234,56', '1.5M', '£1,234', '-500',
+                          # Decimal commas are not thousands separators
+                          '12,34', '0,5', '€12,50', '1,5K',
+                          # Layouts parse_amount reads differently from the bulk layouts
+                          '$1.5K', '$-100', '1e5', '(100', '100)', '- 100', '(1.5K)', '-1.5K',
+                          '1.234K', '.5', '-0', '(0)', '99999999999999999999'])
+
+        result = self.parser.parse_amount_series(data)
+
+        for i, value in enumerate(data):
+            expected = self.parser.parse_amount(value)
+            if expected['parsed_value'] is None:
+                self.assertTrue(np.isnan(result['parsed_value'][i]), value)
+                self.assertEqual(result['error'][i], 'Unrecognized amount format')
+            else:
+                self.assertEqual(result['parsed_value'][i], expected['parsed_value'], value)
+            self.assertEqual(result['is_negative'][i], expected['is_negative'], value)
+            self.assertEqual(result['currency'][i], expected['currency'], value)
+            self.assertEqual(result['abbreviation'][i], expected.get('abbreviation'), value)
+
+    def test_parse_amount_series_with_nulls(self):
+        """Test batch parsing of empty and null values."""
+        data = pd.Series([None, '', 1000], index=['a', 'b', 'c'])
+
+        result = self.parser.parse_amount_series(data)
+
+        self.assertListEqual(list(result.index), ['a', 'b', 'c'])
+        self.assertEqual(result['error']['a'], 'Empty value')
+        self.assertEqual(result['error']['b'], 'Empty value')
+        self.assertEqual(result['parsed_value']['c'], 1000.0)
+
+    def test_parse_amount_series_long_cell(self):
+        """Test that one very long cell does not size the work for the whole column."""
+        data = pd.Series(['-100', 'x' * 10_000_000, '(2,500.00)'] + [str(i) for i in range(1000)])
+
+        result = self.parser.parse_amount_series(data)
+
+        self.assertListEqual(result['is_negative'][:3].tolist(), [True, False, True])
+        self.assertEqual(result['error'][1], 'Unrecognized amount format')
+
+    def test_parse_amount_kelvin_sign_suffix(self):
+        """Test that the Kelvin sign is not read as a 'K' abbreviation."""
+        result = self.parser.parse_amount('5\u212a')
+        
+        self.assertIsNone(result['parsed_value'])
+        self.assertTrue(result['error'].startswith('Invalid numeric format'))
+        self.assertEqual(self.parser.parse_amount('5k')['parsed_value'], 5000.0)
+
+    def test_parse_date_pattern_fallback(self):
+        """Test date patterns used when dateutil cannot parse the value."""
+        result = self.parser.parse_date('31-Dec-2023 (posted)')
+
+        self.assertEqual(result['format'], 'DD-MON-YYYY')
+        self.assertEqual((result['year'], result['month'], result['day']), (2023, 12, 31))
+
+        result = self.parser.parse_date('12/31/2023 (posted)')
+
+        self.assertEqual(result['format'], 'MM/DD/YYYY')
+        self.assertEqual(result['day'], 31)
+
+    def test_parse_amount_cached_result_is_copy(self):
+        """Test that memoized results cannot be mutated by callers."""
+        first = self.parser.parse_amount('$1,234.56')
+        first['parsed_value'] = None
+
+        second = self.parser.parse_amount('$1,234.56')
+
+        self.assertAlmostEqual(second['parsed_value'], 1234.56)
+
+    def test_parse_date_series(self):
+        """Test column-wise date parsing including Excel serial dates."""
+        data = pd.Series(['44927', 44928, '2023-12-31', 'Invalid', None])
+
+        result = self.parser.parse_date_series(data)
+
+        self.assertEqual(result['format'][0], 'excel_serial')
+        self.assertEqual(result['parsed_value'][0], self.parser.parse_date('44927')['parsed_value'])
+        self.assertEqual((result['year'][1], result['month'][1], result['day'][1]), (2023, 1, 2))
+        self.assertEqual(result['day'][2], 31)
+        self.assertIsNone(result['parsed_value'][3])
+        self.assertEqual(result['error'][4], 'Empty value')
+
+    def test_parse_series_compact(self):
+        """Test that compact results keep the values but store labels as categoricals."""
+        amounts = pd.Series(['$1,234.56', '€1.234,56', '$10', None] * 3)
+        full = self.parser.parse_amount_series(amounts)
+        compact = self.parser.parse_amount_series(amounts, compact=True)
+        
+        self.assertEqual(compact['currency'].dtype, 'category')
+        self.assertEqual(list(compact['currency'].cat.categories), ['EUR', 'USD'])
+        self.assertEqual(compact['currency'].astype(object).where(compact['currency'].notna(), None).tolist(),
+                         full['currency'].tolist())
+        pd.testing.assert_series_equal(compact['parsed_value'], full['parsed_value'])
+        
+        dates = self.parser.parse_date_series(pd.Series(['2023-12-31', '44927', 'Invalid']), compact=True)
+        self.assertEqual(dates['format'].dtype, 'category')
+        self.assertEqual(dates['format'][1], 'excel_serial')
+
+    def test_parse_amount_series_numeric_column(self):
+        """Test that numeric columns take the direct path with the same results as parse_amount."""
+        values = pd.Series([1234.56, -500.0, -0.0, np.nan, np.inf, -np.inf, 1e20, 7], index=list('abcdefgh'))
+        
+        result = self.parser.parse_amount_series(values)
+        
+        for label, value in values.items():
+            expected = self.parser.parse_amount(value)
+            if expected['parsed_value'] is None:
+                self.assertTrue(np.isnan(result.loc[label, 'parsed_value']))
+            else:
+                self.assertEqual(result.loc[label, 'parsed_value'], expected['parsed_value'])
+            self.assertEqual(result.loc[label, 'is_negative'], expected['is_negative'])
+        self.assertEqual(result.loc['b', 'parsed_value'], 500.0)
+        self.assertTrue(result.loc['b', 'is_negative'])
+        self.assertEqual(result.loc['d', 'error'], 'Empty value')
+        self.assertIsNone(result.loc['e', 'error'])
+        # The text path gives the same frame for the same numbers
+        pd.testing.assert_frame_equal(result, self.parser.parse_amount_series(values.astype(object)))
+
+    def test_parse_amount_series_scaled(self):
+        """Test fixed-point amounts and their exact Decimal conversion."""
+        result = self.parser.parse_amount_series(pd.Series(['$1,234.56', '0.1', 'Invalid']), scale=100)
+        
+        self.assertEqual(str(result['scaled_value'].dtype), 'Int64')
+        self.assertEqual(result['scaled_value'][0], 123456)
+        self.assertEqual(result['scaled_value'][1], 10)
+        self.assertTrue(pd.isna(result['scaled_value'][2]))
+        self.assertEqual(to_decimal(result['scaled_value']).tolist(), [Decimal('1234.56'), Decimal('0.1'), None])
+
+    def test_normalize_currency_separator_groups(self):
+        """Test that every thousands group is removed in a single pass."""
+        self.assertEqual(self.parser.normalize_currency('1,234,567.89'), '1234567.89')
+        self.assertEqual(self.parser.normalize_currency('1.234.567,89'), '1234567.89')
+        self.assertAlmostEqual(self.parser.parse_amount('1,000,000')['parsed_value'], 1000000.0)
+
+    def test_parse_date_series_matches_parse_date(self):
+        """Test that vectorized fixed-layout dates agree with parse_date."""
+        values = ['2023-12-31', '1/2/2024', '31/12/2023', '2023-02-30', 'Q4 2023', 'Dec 2023']
+        
+        result = self.parser.parse_date_series(pd.Series(values))
+        
+        for i, value in enumerate(values):
+            expected = self.parser.parse_date(value)
+            self.assertEqual(result['parsed_value'][i], expected['parsed_value'])
+            self.assertEqual(result['format'][i], expected['format'])
+
+    def test_parse_date_early_rejection_and_defaults(self):
+        """Test that digitless strings are rejected and partial dates do not depend on today."""
+        for value in ('March', 'Notes', '1/2'):
+            result = self.parser.parse_date(value)
+            self.assertIsNone(result['parsed_value'])
+            self.assertIn('Unrecognized date format', result['error'])
+        
+        self.assertEqual(self.parser.parse_date('Dec 2023')['parsed_value'], datetime(2023, 12, 1))
+
+    def test_slash_date_order(self):
+        """Test that slash dates are read day-first only when the values or settings require it."""
+        result = self.parser.parse_date('31/12/2023 (posted)')
+        self.assertEqual(result['format'], 'DD/MM/YYYY')
+        self.assertEqual(result['parsed_value'], datetime(2023, 12, 31))
+        self.assertEqual(self.parser.parse_date('01/02/2024 (posted)')['format'], 'MM/DD/YYYY')
+        
+        dayfirst_parser = FormatParser(dayfirst=True)
+        self.assertEqual(dayfirst_parser.parse_date('01/02/2024')['parsed_value'], datetime(2024, 2, 1))
+        self.assertEqual(dayfirst_parser.parse_date('01/02/2024 (posted)')['format'], 'DD/MM/YYYY')
+        self.assertEqual(dayfirst_parser.parse_date('12/31/2023')['parsed_value'], datetime(2023, 12, 31))
+        series_result = dayfirst_parser.parse_date_series(pd.Series(['01/02/2024']))
+        self.assertEqual(series_result['parsed_value'][0], datetime(2024, 2, 1))
+
+    def test_parse_excel_serial_series(self):
+        """Test vectorized Excel serial conversion to a datetime64 column."""
+        result = self.parser.parse_excel_serial_series(pd.Series(['44927', 44927.5, 'x', 0, None]))
+        
+        self.assertTrue(pd.api.types.is_datetime64_any_dtype(result))
+        self.assertEqual(result[0], self.parser.parse_date('44927')['parsed_value'])
+        self.assertEqual(result[1], pd.Timestamp(2023, 1, 1, 12))
+        self.assertTrue(result[2:].isna().all())
+
+    def test_adaptive_date_pattern_order(self):
+        """Test that adaptive reordering keeps overlapping patterns in precedence order."""
+        parser = FormatParser(adaptive=True)
+        for i in range(1024):
+            parser.parse_date(f'Period{i} 2023')
+        
+        self.assertEqual(parser.parse_date('Period 2024')['format'], 'Month-Year')
+        self.assertEqual(parser.parse_date('Q3 2024 (posted)')['format'], 'Quarter')
+        self.assertEqual(parser.parse_date('12/31/2023 (posted)')['format'], 'MM/DD/YYYY')
+
+
+if __name__ == '__main__':
+    unittest.main()
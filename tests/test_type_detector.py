@@ -1,7 +1,7 @@
 import unittest
 import pandas as pd
 import numpy as np
-from src.core.type_detector import DataTypeDetector
+from src.core.type_detector import DataTypeDetector, _fast_date_mask
 
 
 class TestDataTypeDetector(unittest.TestCase):
@@ -176,6 +176,71 @@ class TestDataTypeDetector(unittest.TestCase):
         numeric_scores = numeric_result['scores']
         self.assertAlmostEqual(sum(numeric_scores.values()), 1.0, places=1)
 
+    def test_date_and_number_scores(self):
+        """Test vectorized date/number scores on repeated and edge-case values."""
+        data = pd.Series(['44927', ' 44927 ', '1_000', '2023-01-01', '2023-01-01',
+                          '999', '73051', '44927.5', 'nan', 'text'])
+
+        # Serials 44927 (x2) and 1_000, plus the two ISO dates
+        self.assertAlmostEqual(self.detector._detect_date_format(data), 0.5)
+        # Everything except the ISO dates and 'text'; 'nan' parses as a float
+        self.assertAlmostEqual(self.detector._detect_number_format(data), 0.7)
+
+    def test_scores_follow_float_parsing(self):
+        """Test that number and serial checks accept exactly what float() accepts."""
+        data = pd.Series(['5e 0', '1e3', '1000.00000000000001', '12345678901234567.5'])
+
+        # '5e 0' is not a float; the long mantissas parse like float() does
+        self.assertAlmostEqual(self.detector._detect_number_format(data), 0.75)
+        # Only 1e3 and 1000.00000000000001 (== 1000.0 as a float) are whole serials in range
+        self.assertAlmostEqual(self.detector._detect_date_format(data), 0.5)
+
+    def test_fast_date_mask(self):
+        """Test the code-point date layout check agrees with the date patterns."""
+        values = np.array(['2023-01-31', '2023-01-31 10:00', '12/31/2023', '1/2/2023',
+                           '2023-1-5', '2023/01/31', '', '12', 'Dec 2023', '２023-01-31'], dtype=object)
+
+        mask = _fast_date_mask(values)
+
+        self.assertEqual(mask.tolist(), [True, True, True] + [False] * 7)
+        # Every fast hit is also a regex hit
+        for value in values[mask]:
+            self.assertIsNotNone(self.detector._date_union.match(value))
+
+    def test_analyze_column_samples_large_columns(self):
+        """Test that large columns are scored on a sample, unless sampling is disabled."""
+        data = pd.Series([f'${i},000.00' for i in range(12000)] + [None] * 100)
+
+        result = self.detector.analyze_column(data)
+        self.assertEqual(result['type'], 'number')
+        self.assertTrue(result['sampled'])
+        self.assertEqual(result['sample_size'], 5000)
+
+        result = DataTypeDetector(sample_size=None).analyze_column(data)
+        self.assertEqual(result['type'], 'number')
+        self.assertFalse(result['sampled'])
+        self.assertEqual(result['sample_size'], 12000)
+
+    def test_analyze_column_reuses_identical_columns(self):
+        """Test that columns with identical values share one cached analysis."""
+        first = pd.Series(['2023-01-01', '2023-01-02', None], name='Posting Date')
+        same = pd.Series(['2023-01-01', '2023-01-02'], name='Due Date', index=[5, 9])
+        different = pd.Series(['2023-01-02', '2023-01-01'])
+
+        result = self.detector.analyze_column(first)
+        self.assertEqual(self.detector.analyze_column(same), result)
+        self.assertEqual(result['type'], 'date')
+        self.assertEqual(len(self.detector._analysis_cache), 1)
+        self.detector.analyze_column(different)
+        self.assertEqual(len(self.detector._analysis_cache), 2)
+        
+        # Changes to a returned result do not reach the cache
+        result['type'] = 'string'
+        result['scores']['date'] = 0.0
+        again = self.detector.analyze_column(same)
+        self.assertEqual(again['type'], 'date')
+        self.assertGreater(again['scores']['date'], 0.0)
+
 
 if __name__ == '__main__':
     unittest.main()